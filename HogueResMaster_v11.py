@@ -16,7 +16,9 @@ This build is designed for chat use:
 """
 
 from __future__ import annotations
-import os, re, sys, difflib, datetime, zipfile
+import os, re, io, sys, time, bisect, difflib, datetime, zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -26,6 +28,8 @@ try:
     import docx
     from docx.shared import Pt, Inches
     from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
 except Exception:
     DOCX_OK=False
 
@@ -102,27 +106,57 @@ STYLE_PACKS = {
     "CV":       {"font":"Times New Roman", "size":11},
 }
 
+# Precompiled patterns (hot text paths)
+_WORD_RE      = re.compile(r"[A-Za-z]{2,}")
+_NUM_RE       = re.compile(r"[%$€£]\s?\d|\d{1,3}(?:,\d{3})*(?:\.\d+)?%?")
+_URL_RE       = re.compile(r"https?://\S+")
+_HTTP_RE      = re.compile(r"^https?://")
+_DIGIT_RE     = re.compile(r"\d")
+_RTF_CTRL_RE  = re.compile(r"\{\\\*?[^}]*\}|\\[a-z]+\d* ?|[{}]")
+_RESUME_NAME_RE = re.compile(r"(resume|cv)\.(docx|pdf|rtf|txt)$", re.I)
+_JOB_NAME_RE    = re.compile(r"(job|jd|posting|description)\.(docx|pdf|rtf|txt|html|htm)$", re.I)
+_NAME_LINE_RE   = re.compile(r"^([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))$")
+_NAME_FIELD_RE  = re.compile(r"Name[:\-]\s*([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))")
+_COMPANY_RE     = re.compile(r"Company[:\-]\s*([^\n]+)", re.I)
+_TITLE_RE       = re.compile(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", re.I)
+_ACTION_VERB_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, ACTION_VERBS)) + r")\b", re.I)
+
+def _word_patterns(terms) -> dict:
+    return {t: re.compile(rf"\b{re.escape(t)}\b") for t in terms}
+
+_MED_CERT_RES = _word_patterns(MED_CERTS)
+_MED_EMR_RES  = _word_patterns(MED_EMR)
+_MED_COMP_RES = _word_patterns(MED_COMPLIANCE)
+_VET_CODE_RES = _word_patterns(VET_CROSSWALK)
+
 # ===================== Utility =====================
 def clean_tokens(text: str) -> List[str]:
-    return [t for t in re.findall(r"[A-Za-z]{2,}", (text or "").lower()) if t not in STOPWORDS]
+    return [t for t in _WORD_RE.findall((text or "").lower()) if t not in STOPWORDS]
 
-def kw_set(text: str, topn=400) -> set:
+@lru_cache(maxsize=64)
+def kw_set(text: str, topn=400) -> frozenset:
+    # Memoized: the same JD/resume text is tokenized by scoring and keyword injection.
     toks = clean_tokens(text)
     seen, out = set(), []
     for t in toks:
         if t not in seen:
             seen.add(t); out.append(t)
-    return set(out[:topn])
+    return frozenset(out[:topn])
 
+@lru_cache(maxsize=64)
 def ats_score(tx: str) -> int:
-    vcount = sum(1 for v in ACTION_VERBS if re.search(rf"\b{re.escape(v)}\b", (tx or "").lower()))
-    nums = len(re.findall(r"[%$€£]\s?\d|\d{1,3}(?:,\d{3})*(?:\.\d+)?%?", tx or ""))
-    urls = len(re.findall(r"https?://\S+", tx or ""))
+    # distinct verbs used, found in one pass over the text
+    vcount = len({v.lower() for v in _ACTION_VERB_RE.findall(tx or "")})
+    nums = len(_NUM_RE.findall(tx or ""))
+    urls = len(_URL_RE.findall(tx or ""))
     raw = 0.5*min(1.0, vcount/18) + 0.3*min(1.0, nums/12) + 0.2*min(1.0, urls/3)
     return int(round(raw*100))
 
+GRADE_CUTS = (60, 70, 73, 77, 80, 83, 87, 90, 93, 97)
+GRADES     = ("F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
 def letter_grade(x: int):
-    return "A+" if x>=97 else "A" if x>=93 else "A-" if x>=90 else "B+" if x>=87 else "B" if x>=83 else "B-" if x>=80 else "C+" if x>=77 else "C" if x>=73 else "C-" if x>=70 else "D" if x>=60 else "F"
+    return GRADES[bisect.bisect_right(GRADE_CUTS, x)]
 
 def composite_scores(jd: str, txt: str):
     jks, tks = kw_set(jd), kw_set(txt)
@@ -132,20 +166,26 @@ def composite_scores(jd: str, txt: str):
     return cov, ats, hire, letter_grade(hire)
 
 # ===================== IO =====================
+def _read_plain(path: Path) -> str:
+    # One bulk read + decode; newline handling matches text-mode read_text()
+    tx = path.read_bytes().decode("utf-8", errors="ignore")
+    if "\r" in tx: tx = tx.replace("\r\n", "\n").replace("\r", "\n")
+    return tx
+
 def read_text_any(path_or_url: str) -> str:
     if not path_or_url: return ""
     p = str(path_or_url)
     try:
-        if re.match(r"^https?://", p) and REQ_OK:
+        if _HTTP_RE.match(p) and REQ_OK:
             r = requests.get(p, timeout=20)
             if r.ok: return r.text
         path = Path(p)
         if not path.exists(): return ""
         if p.lower().endswith(".txt"):
-            return path.read_text(encoding="utf-8", errors="ignore")
+            return _read_plain(path)
         if p.lower().endswith(".rtf"):
-            raw = path.read_text(encoding="utf-8", errors="ignore")
-            return re.sub(r"\{\\\*?[^}]*\}|\\[a-z]+\d* ?|[{}]", "", raw)
+            raw = _read_plain(path)
+            return _RTF_CTRL_RE.sub("", raw)
         if p.lower().endswith(".docx") and DOCX_OK:
             d = docx.Document(str(path))
             return "\n".join([pg.text for pg in d.paragraphs])
@@ -157,17 +197,17 @@ def read_text_any(path_or_url: str) -> str:
                     txt.append(pg.extract_text() or "")
             return "\n".join(txt)
         if p.lower().endswith(".html") or p.lower().endswith(".htm"):
-            return path.read_text(encoding="utf-8", errors="ignore")
+            return _read_plain(path)
     except Exception as e:
         ui_debug(f"[read_text_any] {e}")
     return ""
 
 # ===================== Detection =====================
 def _looks_resume(p: Path) -> bool:
-    return bool(re.search(r"(resume|cv)\.(docx|pdf|rtf|txt)$", p.name, re.I))
+    return bool(_RESUME_NAME_RE.search(p.name))
 
 def _looks_job(p: Path) -> bool:
-    return bool(re.search(r"(job|jd|posting|description)\.(docx|pdf|rtf|txt|html|htm)$", p.name, re.I))
+    return bool(_JOB_NAME_RE.search(p.name))
 
 def scan_uploads(search_dir: Path) -> dict:
     found = {"resume": None, "job": None}
@@ -185,9 +225,9 @@ def guess_name_from_text(resume_text: str) -> str:
     if not resume_text: return "Candidate"
     lines = [ln.strip() for ln in resume_text.splitlines() if ln.strip()]
     for ln in lines[:5]:
-        m = re.match(r"^([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))$", ln)
+        m = _NAME_LINE_RE.match(ln)
         if m: return m.group(1)
-    m = re.search(r"Name[:\-]\s*([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))", resume_text)
+    m = _NAME_FIELD_RE.search(resume_text)
     return m.group(1) if m else "Candidate"
 
 def build_payload(name: str) -> Dict[str, Any]:
@@ -214,9 +254,9 @@ def payload_to_text(payload)->str:
 
 def apply_medical_enhancements(payload, resume_text, jd_text):
     both = (resume_text + " " + jd_text)
-    certs = [c for c in MED_CERTS if re.search(rf"\b{re.escape(c)}\b", both)]
-    emr   = [e for e in MED_EMR if re.search(rf"\b{re.escape(e)}\b", both)]
-    comp  = [c for c in MED_COMPLIANCE if re.search(rf"\b{re.escape(c)}\b", both)]
+    certs = [c for c, pat in _MED_CERT_RES.items() if pat.search(both)]
+    emr   = [e for e, pat in _MED_EMR_RES.items() if pat.search(both)]
+    comp  = [c for c, pat in _MED_COMP_RES.items() if pat.search(both)]
     if certs: payload.setdefault("licenses_certs", certs[:6])
     if emr or comp:
         payload["summary"] += " Experienced with " + ", ".join((emr[:2] or comp[:2])) + "."
@@ -240,7 +280,7 @@ def apply_federal_formatting(payload):
 
 def enrich_from_vet_codes(payload, resume_text):
     for code, trans in VET_CROSSWALK.items():
-        if re.search(rf"\b{re.escape(code)}\b", resume_text):
+        if _VET_CODE_RES[code].search(resume_text):
             if trans not in payload["core_items"]:
                 payload["core_items"].append(trans)
     return payload
@@ -271,7 +311,7 @@ def inject_keywords(payload, jd_text, per_section_caps=(2,2,2)):
 def ensure_metric_shell(payload):
     if not payload.get("experience"): return payload
     b = payload["experience"][0].get("bullets", [])
-    if not any(re.search(r"\d", x) for x in b):
+    if not any(_DIGIT_RE.search(x) for x in b):
         b.insert(0, "Improved adoption by [CONFIRM]% and renewal rate by [CONFIRM]% across assigned accounts.")
         payload["experience"][0]["bullets"] = b
     return payload
@@ -284,14 +324,52 @@ def scan_risk(text: str) -> List[str]:
     return flags
 
 # ===================== Writers =====================
+# Bytes of outputs written this run, so packaging doesn't re-read them from disk
+_WRITTEN: Dict[str, bytes] = {}
+
+def _save_bytes(out_path: Path, data: bytes) -> Path:
+    out_path.write_bytes(data)
+    _WRITTEN[str(out_path)] = data
+    return out_path
+
+def _save_text(out_path: Path, text: str) -> Path:
+    if os.linesep != "\n": text = text.replace("\n", os.linesep)
+    return _save_bytes(out_path, text.encode("utf-8"))
+
+def _save_docx(out_path: Path, doc) -> Path:
+    buf = io.BytesIO(); doc.save(buf)
+    return _save_bytes(out_path, buf.getvalue())
+
 def rtf_escape(s: str) -> str:
     return s.replace("\\", "\\\\").replace("{","\\{").replace("}","\\}")
 
+_DOCX_TEMPLATE = None
+
+def _new_document():
+    """Blank document from a cached copy of the default template (loaded from disk once per run)."""
+    global _DOCX_TEMPLATE
+    if _DOCX_TEMPLATE is None:
+        buf = io.BytesIO(); docx.Document().save(buf)
+        _DOCX_TEMPLATE = buf.getvalue()
+    return docx.Document(io.BytesIO(_DOCX_TEMPLATE))
+
+def _append_lines(doc, lines):
+    """Bulk-append plain paragraphs as raw OXML, skipping python-docx's per-call Paragraph/Run wrappers."""
+    body = doc.element.body
+    anchor = body.sectPr
+    for ln in lines:
+        p = OxmlElement("w:p")
+        if ln:
+            t = OxmlElement("w:t"); t.text = ln
+            if ln != ln.strip(): t.set(qn("xml:space"), "preserve")
+            r = OxmlElement("w:r"); r.append(t); p.append(r)
+        if anchor is not None: anchor.addprevious(p)
+        else: body.append(p)
+
 def write_docx_resume(out_path: Path, payload, style_pack="Classic"):
-    tx = payload_to_text(payload)
     if not DOCX_OK:
         return write_rtf_resume(out_path.with_suffix(".rtf"), payload)
-    doc=docx.Document()
+    doc=_new_document()
     sp = STYLE_PACKS.get(style_pack, STYLE_PACKS["Classic"])
     style=doc.styles['Normal']; style.font.name=sp["font"]; style.font.size=Pt(sp["size"])
 
@@ -311,23 +389,21 @@ def write_docx_resume(out_path: Path, payload, style_pack="Classic"):
     # Federal preface (if selected or detected)
     if style_pack=="Federal":
         doc.add_paragraph().add_run("Federal Information").bold=True
-        for line in FEDERAL_SECTIONS:
-            doc.add_paragraph("• " + line)
+        _append_lines(doc, ["• " + line for line in FEDERAL_SECTIONS])
 
     # Experience
     if payload.get("experience"):
         doc.add_paragraph().add_run("Experience").bold=True
         for j in payload["experience"]:
             run=doc.add_paragraph().add_run(f"{j.get('title','')} — {j.get('company','')} ({j.get('dates','')})"); run.bold=True
-            for b in j.get("bullets",[]): doc.add_paragraph("• "+b)
+            _append_lines(doc, ["• "+b for b in j.get("bullets",[])])
 
     # Education
     if payload.get("education"):
         doc.add_paragraph().add_run("Education").bold=True
         doc.add_paragraph(payload.get("education",""))
 
-    doc.save(str(out_path))
-    return out_path
+    return _save_docx(out_path, doc)
 
 def write_rtf_resume(out_path: Path, payload):
     body = []
@@ -349,8 +425,7 @@ def write_rtf_resume(out_path: Path, payload):
         body.append(r"\b Education\b0\par")
         body.append(rtf_escape(payload.get("education","")) + r"\par")
     body.append("}")
-    out_path.write_text("".join(body), encoding="utf-8")
-    return out_path
+    return _save_text(out_path, "".join(body))
 
 def write_docx_cover(out_path: Path, name:str, company:str, title:str, style_pack="Classic"):
     content = f"""Dear Hiring Team,
@@ -362,13 +437,12 @@ Sincerely,
 """
     if not DOCX_OK:
         out_path = out_path.with_suffix(".rtf")
-        out_path.write_text("{\\rtf1\\ansi " + rtf_escape(content) + "}", encoding="utf-8")
-        return out_path
-    doc=docx.Document()
+        return _save_text(out_path, "{\\rtf1\\ansi " + rtf_escape(content) + "}")
+    doc=_new_document()
     sp = STYLE_PACKS.get(style_pack, STYLE_PACKS["Classic"])
     style=doc.styles['Normal']; style.font.name=sp["font"]; style.font.size=Pt(sp["size"])
-    for ln in content.split("\n"): doc.add_paragraph(ln)
-    doc.save(str(out_path)); return out_path
+    _append_lines(doc, content.split("\n"))
+    return _save_docx(out_path, doc)
 
 def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_snip:str):
     html=f"""<!doctype html><html><meta charset='utf-8'><title>Interview Guide</title>
@@ -388,20 +462,31 @@ def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_sni
 <h2>Job Snippet</h2>
 <pre style='white-space:pre-wrap'>{jd_snip[:1500]}</pre>
 </html>"""
-    out_path.write_text(html, encoding="utf-8"); return out_path
+    return _save_text(out_path, html)
 
 def write_redline(out_path: Path, before:str, after:str):
     diff = "\n".join(difflib.unified_diff(before.splitlines(), after.splitlines(), fromfile="before", tofile="after", lineterm=""))
-    out_path.write_text(diff, encoding="utf-8"); return out_path
+    return _save_text(out_path, diff)
 
 def write_ats_txt(out_path: Path, txt:str):
-    out_path.write_text(txt, encoding="utf-8"); return out_path
+    return _save_text(out_path, txt)
+
+# Already-compressed containers gain nothing from a second deflate pass
+STORED_EXT = {".docx",".pdf",".zip",".png",".jpg",".jpeg"}
 
 def zip_deliverables(zip_path: Path, files: List[Path]):
     with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
         for f in files:
-            if f and Path(f).exists():
-                z.write(f, arcname=Path(f).name)
+            if not f: continue
+            f = Path(f)
+            ctype = zipfile.ZIP_STORED if f.suffix.lower() in STORED_EXT else zipfile.ZIP_DEFLATED
+            data = _WRITTEN.pop(str(f), None)
+            if data is not None:
+                zi = zipfile.ZipInfo(f.name, date_time=time.localtime()[:6])
+                zi.compress_type = ctype; zi.external_attr = 0o644 << 16
+                z.writestr(zi, data)
+            elif f.exists():
+                z.write(f, arcname=f.name, compress_type=ctype)
     return zip_path
 
 # ===================== Flow =====================
@@ -417,15 +502,14 @@ def detect_and_read():
 
 def guess_company_and_title(jd_text: str, jd_path: str="") -> (str,str):
     company=""; title=""
-    m = re.search(r"Company[:\-]\s*([^\n]+)", jd_text, re.I)
+    m = _COMPANY_RE.search(jd_text)
     if m: company = m.group(1).strip()
-    m = re.search(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", jd_text, re.I)
+    m = _TITLE_RE.search(jd_text)
     if m: title = m.group(2).strip()
     if not title:
-        lines=[ln.strip() for ln in jd_text.splitlines() if ln.strip()]
-        if lines: title = lines[0][:80]
-    if not company and jd_path and re.match(r"^https?://", str(jd_path)):
-        host = re.sub(r"^https?://","", str(jd_path)).split("/")[0]
+        title = next((ln for ln in map(str.strip, jd_text.splitlines()) if ln), "")[:80]
+    if not company and jd_path and _HTTP_RE.match(str(jd_path)):
+        host = _HTTP_RE.sub("", str(jd_path)).split("/")[0]
         host = host.split(":")[0]
         parts = host.split(".")
         if len(parts)>=2: company = parts[-2].capitalize()
@@ -476,22 +560,22 @@ def main():
         company, title = guess_company_and_title(jd_text, str(jd_p))
 
         base = f"{(name).replace(' ','_')}_{(company or 'Company').replace(' ','_')}_{(title or 'Role').replace(' ','_')}_{TODAY}"
-        saved = []
-
         resume_path = outdir / f"{base}_RESUME.docx"
-        saved.append(str(write_docx_resume(resume_path, payload, style_pack=style_pack)))
-
         cover_path  = outdir / f"{base}_COVER.docx"
-        saved.append(str(write_docx_cover(cover_path, name, company or "", title or "", style_pack=style_pack)))
-
         guide_path  = outdir / f"{base}_GUIDE.html"
-        saved.append(str(write_html_guide(guide_path, company or "", title or "", {"cov":cov,"ats":ats,"hire":hire,"grade":grade}, jd_text[:2000])))
-
         ats_path    = outdir / f"{base}_ATS.txt"
-        saved.append(str(write_ats_txt(ats_path, after_txt)))
-
         redline_path= outdir / f"{base}_REDLINE.diff.txt"
-        saved.append(str(write_redline(redline_path, before_txt, after_txt)))
+
+        # Writers are independent; run them side by side, keep the listing order
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futs = [
+                ex.submit(write_docx_resume, resume_path, payload, style_pack=style_pack),
+                ex.submit(write_docx_cover, cover_path, name, company or "", title or "", style_pack=style_pack),
+                ex.submit(write_html_guide, guide_path, company or "", title or "", {"cov":cov,"ats":ats,"hire":hire,"grade":grade}, jd_text[:2000]),
+                ex.submit(write_ats_txt, ats_path, after_txt),
+                ex.submit(write_redline, redline_path, before_txt, after_txt),
+            ]
+            saved = [str(f.result()) for f in futs]
 
         # Risk scan (basic regex flags)
         flags = scan_risk(jd_text)
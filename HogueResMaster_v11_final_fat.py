@@ -16,7 +16,8 @@ This build is designed for chat use:
 """
 
 from __future__ import annotations
-import os, re, sys, difflib, datetime, zipfile
+import os, re, sys, bisect, difflib, datetime, zipfile, importlib
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -27,25 +28,29 @@ FAT_MODE = True
 BUILD_LABEL = "v11 final fat"
 
 # Optional deps
-DOCX_OK=True
+# docx/PyPDF2/pypdfium2/requests are imported on first use: a plain-text run never pays for them
+_LAZY_MODS: Dict[str, Any] = {}
+
+def _optional(name: str):
+    """Return module `name`, or None if it is not installed. Imported once, on first call."""
+    if name not in _LAZY_MODS:
+        try:
+            _LAZY_MODS[name] = importlib.import_module(name)
+        except Exception:
+            _LAZY_MODS[name] = None
+    return _LAZY_MODS[name]
+
+AC_OK=True
 try:
-    import docx
-    from docx.shared import Pt, Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except Exception:
-    DOCX_OK=False
-
-PDF_OK=True
-try:
-    import PyPDF2
+    import ahocorasick
 except Exception:
-    PDF_OK=False
+    AC_OK=False
 
-REQ_OK=True
+ORJSON_OK=True
 try:
-    import requests
+    import orjson
 except Exception:
-    REQ_OK=False
+    ORJSON_OK=False
 
 TODAY = datetime.date.today().strftime("%Y-%m-%d")
 
@@ -69,7 +74,7 @@ I will rebuild an ATS-safe resume, write a sincere cover letter, create an inter
 """
 
 # ===================== Data & Heuristics =====================
-STOPWORDS = set("a an and or the but with for to from on in at as by of be is are was were will would shall should can could into within without among across per plus via than then that this those it its your you we our they them their he she his her who whom which what when where why how".split())
+STOPWORDS = frozenset("a an and or the but with for to from on in at as by of be is are was were will would shall should can could into within without among across per plus via than then that this those it its your you we our they them their he she his her who whom which what when where why how".split())
 ACTION_VERBS = ["led","owned","built","delivered","implemented","orchestrated","spearheaded","optimized","designed","launched","scaled","improved","reduced","increased","managed","developed","drove","partnered","enabled","accelerated","transformed","modernized"]
 
 AGG_DOMAINS = {"indeed.com","ziprecruiter.com","linkedin.com","glassdoor.com","monster.com","simplyhired.com","jobcase.com"}
@@ -83,6 +88,17 @@ SCAM_PATTERNS = {
     "urgent_now": re.compile(r"(urgent|immediate)\s+(hiring|start)", re.I),
     "wire_gift": re.compile(r"(gift\s*card|bitcoin|crypto|wire\s*transfer)", re.I),
 }
+# Literals of which at least one must occur (in _fold_i'd text) for the pattern to match
+SCAM_CUES = {
+    "upfront_fee": ("pay",),
+    "telegram_only": ("telegram","whatsapp"),
+    "install_software": ("install","download"),
+    "bank_ssn": ("ssn","social security","bank","routing","account"),
+    "generic_email": ("gmail","yahoo","outlook","hotmail"),
+    "too_good_pay": ("$",),
+    "urgent_now": ("urgent","immediate"),
+    "wire_gift": ("gift","bitcoin","crypto","wire"),
+}
 
 MED_CERTS = {"CNA","LPN","LVN","RN","BSN","MSN","NP","PA-C","MD","DO","EMT","EMT-B","EMT-I","EMT-P","Paramedic","RRT","CRT","PT","DPT","OT","COTA","SLP","PharmD","RPh","CPhT","CRCST","ARRT","CNMT","CPR","BLS","ACLS","PALS","NRP","TNCC","ENPC","ATLS","RHIT","RHIA","CPC","CCS","CCA","COC","CIC","CHDA","CRCR"}
 MED_COMPLIANCE = {"HIPAA","OSHA","JCAHO","The Joint Commission","CLIA","CAP","IRB","GCP","ICH-GCP","FDA","EMA","21 CFR Part 11"}
@@ -108,27 +124,89 @@ STYLE_PACKS = {
     "CV":       {"font":"Times New Roman", "size":11},
 }
 
+# Precompiled patterns (hot text paths)
+_WORD_RE      = re.compile(r"[A-Za-z]{2,}")
+_NUM_RE       = re.compile(r"[%$€£]\s?\d|\d{1,3}(?:,\d{3})*(?:\.\d+)?%?")
+_URL_RE       = re.compile(r"https?://\S+")
+_URL_PREFIXES = ("http://", "https://")
+_DIGIT_RE     = re.compile(r"\d")
+_RTF_CTRL_RE  = re.compile(r"\{\\\*?[^}]*\}|\\[a-z]+\d* ?|[{}]")
+_RESUME_NAME_RE = re.compile(r"(resume|cv)\.(docx|pdf|rtf|txt)$", re.I)
+_JOB_NAME_RE    = re.compile(r"(job|jd|posting|description)\.(docx|pdf|rtf|txt|html|htm)$", re.I)
+_NAME_LINE_RE   = re.compile(r"^([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))$")
+_NAME_FIELD_RE  = re.compile(r"Name[:\-]\s*([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))")
+_COMPANY_RE     = re.compile(r"Company[:\-]\s*([^\n]+)", re.I)
+_TITLE_RE       = re.compile(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", re.I)
+
+def _word_patterns(terms) -> dict:
+    return {t: re.compile(rf"\b{re.escape(t)}\b") for t in terms}
+
+_VERB_RES     = _word_patterns(ACTION_VERBS)
+_MED_CERT_RES = _word_patterns(MED_CERTS)
+_MED_EMR_RES  = _word_patterns(MED_EMR)
+_MED_COMP_RES = _word_patterns(MED_COMPLIANCE)
+_VET_CODE_RES = _word_patterns(VET_CROSSWALK)
+
+# Domain term tables scanned together (one Aho-Corasick pass when available)
+TERM_TABLES = {"cert": _MED_CERT_RES, "emr": _MED_EMR_RES, "comp": _MED_COMP_RES, "vet": _VET_CODE_RES}
+
+def _build_term_automaton():
+    if not AC_OK: return None
+    ac = ahocorasick.Automaton()
+    for tag, table in TERM_TABLES.items():
+        for term in table: ac.add_word(term, (tag, term))
+    ac.make_automaton()
+    return ac
+
+_TERM_AC = _build_term_automaton()
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def find_terms(text: str) -> Dict[str, set]:
+    """Whole-word hits of every TERM_TABLES entry in `text`, grouped by tag."""
+    found = {tag: set() for tag in TERM_TABLES}
+    if _TERM_AC is None:
+        for tag, table in TERM_TABLES.items():
+            found[tag].update(t for t, pat in table.items() if pat.search(text))
+        return found
+    n = len(text)
+    for end, (tag, term) in _TERM_AC.iter(text):
+        start = end - len(term) + 1
+        # same edges as the \b...\b fallback patterns
+        if start > 0 and _is_word_char(text[start-1]): continue
+        if end + 1 < n and _is_word_char(text[end+1]): continue
+        found[tag].add(term)
+    return found
+
 # ===================== Utility =====================
 def clean_tokens(text: str) -> List[str]:
-    return [t for t in re.findall(r"[A-Za-z]{2,}", (text or "").lower()) if t not in STOPWORDS]
-
-def kw_set(text: str, topn=400) -> set:
-    toks = clean_tokens(text)
-    seen, out = set(), []
-    for t in toks:
-        if t not in seen:
-            seen.add(t); out.append(t)
-    return set(out[:topn])
+    return [t for t in _WORD_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+@lru_cache(maxsize=64)
+def kw_set(text: str, topn=400) -> frozenset:
+    # First `topn` distinct tokens in one pass; memoized since the JD and
+    # resume text are scored, diffed and dumped (FAT) several times per run.
+    out = set()
+    for t in _WORD_RE.findall((text or "").lower()):
+        if len(out) >= topn: break
+        if t not in STOPWORDS: out.add(t)
+    return frozenset(out)
 
 def ats_score(tx: str) -> int:
-    vcount = sum(1 for v in ACTION_VERBS if re.search(rf"\b{re.escape(v)}\b", (tx or "").lower()))
-    nums = len(re.findall(r"[%$€£]\s?\d|\d{1,3}(?:,\d{3})*(?:\.\d+)?%?", tx or ""))
-    urls = len(re.findall(r"https?://\S+", tx or ""))
+    low = (tx or "").lower()
+    # substring test first; the word-boundary regex only confirms verbs actually present
+    vcount = sum(1 for v, pat in _VERB_RES.items() if v in low and pat.search(low))
+    nums = len(_NUM_RE.findall(tx or ""))
+    urls = len(_URL_RE.findall(tx or ""))
     raw = 0.5*min(1.0, vcount/18) + 0.3*min(1.0, nums/12) + 0.2*min(1.0, urls/3)
     return int(round(raw*100))
 
+GRADE_CUTS = (60, 70, 73, 77, 80, 83, 87, 90, 93, 97)
+GRADES     = ("F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
 def letter_grade(x: int):
-    return "A+" if x>=97 else "A" if x>=93 else "A-" if x>=90 else "B+" if x>=87 else "B" if x>=83 else "B-" if x>=80 else "C+" if x>=77 else "C" if x>=73 else "C-" if x>=70 else "D" if x>=60 else "F"
+    return GRADES[bisect.bisect_right(GRADE_CUTS, x)]
 
 def composite_scores(jd: str, txt: str):
     jks, tks = kw_set(jd), kw_set(txt)
@@ -142,38 +220,76 @@ def read_text_any(path_or_url: str) -> str:
     if not path_or_url: return ""
     p = str(path_or_url)
     try:
-        if re.match(r"^https?://", p) and REQ_OK:
-            r = requests.get(p, timeout=20)
-            if r.ok: return r.text
-        path = Path(p)
-        if not path.exists(): return ""
-        if p.lower().endswith(".txt"):
-            return path.read_text(encoding="utf-8", errors="ignore")
-        if p.lower().endswith(".rtf"):
-            raw = path.read_text(encoding="utf-8", errors="ignore")
-            return re.sub(r"\{\\\*?[^}]*\}|\\[a-z]+\d* ?|[{}]", "", raw)
-        if p.lower().endswith(".docx") and DOCX_OK:
-            d = docx.Document(str(path))
-            return "\n".join([pg.text for pg in d.paragraphs])
-        if p.lower().endswith(".pdf") and PDF_OK:
-            txt = []
-            with open(path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                for pg in reader.pages:
-                    txt.append(pg.extract_text() or "")
-            return "\n".join(txt)
-        if p.lower().endswith(".html") or p.lower().endswith(".htm"):
-            return path.read_text(encoding="utf-8", errors="ignore")
+        if p.startswith(_URL_PREFIXES):
+            requests = _optional("requests")
+            if requests:
+                r = requests.get(p, timeout=20)
+                if r.ok: return r.text
+        try:
+            st = Path(p).stat()
+        except OSError:
+            return ""
+        return _read_file_cached(p, st.st_mtime_ns, st.st_size)
     except Exception as e:
         ui_debug(f"[read_text_any] {e}")
     return ""
 
+_PDF_WS_RE = re.compile(r"[ \t]+")
+
+def _pdf_text(pages) -> str:
+    """Page texts in one layout whichever engine extracted them: single spaces, no blank lines."""
+    # PDFium collapses space runs and drops blank lines, PyPDF2 keeps both; normalizing
+    # both keeps the name/company/title line heuristics independent of the installed library
+    lines = []
+    for pg in pages:
+        for ln in pg.splitlines():
+            ln = _PDF_WS_RE.sub(" ", ln).strip()
+            if ln: lines.append(ln)
+    return "\n".join(lines)
+
+@lru_cache(maxsize=16)
+def _read_file_cached(p: str, mtime_ns: int, size: int) -> str:
+    # Keyed on (path, mtime, size): an unchanged file is parsed once per process
+    path = Path(p)
+    if p.lower().endswith(".txt"):
+        return path.read_text(encoding="utf-8", errors="ignore")
+    if p.lower().endswith(".rtf"):
+        raw = path.read_text(encoding="utf-8", errors="ignore")
+        return _RTF_CTRL_RE.sub("", raw)
+    if p.lower().endswith(".docx"):
+        docx = _optional("docx")
+        if docx:
+            d = docx.Document(str(path))
+            return "\n".join([pg.text for pg in d.paragraphs])
+        return ""
+    if p.lower().endswith(".pdf"):
+        PyPDF2 = _optional("PyPDF2")
+        pdfium = _optional("pypdfium2")
+        if pdfium:
+            # PDFium (C) extracts text far faster than PyPDF2's pure-Python parser;
+            # a PDF it cannot open still gets a PyPDF2 attempt
+            try:
+                pdf = pdfium.PdfDocument(p)
+                try:
+                    return _pdf_text([pg.get_textpage().get_text_range() for pg in pdf])
+                finally:
+                    pdf.close()
+            except Exception:
+                if not PyPDF2: raise
+        if not PyPDF2: return ""
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            return _pdf_text([pg.extract_text() or "" for pg in reader.pages])
+    if p.lower().endswith(".html") or p.lower().endswith(".htm"):
+        return path.read_text(encoding="utf-8", errors="ignore")
+    return ""
+
 # ===================== Detection =====================
 def _looks_resume(p: Path) -> bool:
-    return bool(re.search(r"(resume|cv)\.(docx|pdf|rtf|txt)$", p.name, re.I))
+    return bool(_RESUME_NAME_RE.search(p.name))
 
 def _looks_job(p: Path) -> bool:
-    return bool(re.search(r"(job|jd|posting|description)\.(docx|pdf|rtf|txt|html|htm)$", p.name, re.I))
+    return bool(_JOB_NAME_RE.search(p.name))
 
 def scan_uploads(search_dir: Path) -> dict:
     found = {"resume": None, "job": None}
@@ -189,11 +305,16 @@ def scan_uploads(search_dir: Path) -> dict:
 # ===================== Builders & Enhancers =====================
 def guess_name_from_text(resume_text: str) -> str:
     if not resume_text: return "Candidate"
-    lines = [ln.strip() for ln in resume_text.splitlines() if ln.strip()]
+    # Only the first 5 non-empty lines matter: split a 2 KB head (cut at a newline so
+    # no line is truncated) instead of the whole resume; a sparse head falls back
+    head = resume_text if len(resume_text) <= 2048 else resume_text[:2048].rpartition("\n")[0]
+    lines = [ln for ln in map(str.strip, head.splitlines()) if ln]
+    if len(lines) < 5 and len(head) < len(resume_text):
+        lines = [ln for ln in map(str.strip, resume_text.splitlines()) if ln]
     for ln in lines[:5]:
-        m = re.match(r"^([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))$", ln)
+        m = _NAME_LINE_RE.match(ln)
         if m: return m.group(1)
-    m = re.search(r"Name[:\-]\s*([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))", resume_text)
+    m = _NAME_FIELD_RE.search(resume_text)
     return m.group(1) if m else "Candidate"
 
 def build_payload(name: str) -> Dict[str, Any]:
@@ -220,9 +341,10 @@ def payload_to_text(payload)->str:
 
 def apply_medical_enhancements(payload, resume_text, jd_text):
     both = (resume_text + " " + jd_text)
-    certs = [c for c in MED_CERTS if re.search(rf"\b{re.escape(c)}\b", both)]
-    emr   = [e for e in MED_EMR if re.search(rf"\b{re.escape(e)}\b", both)]
-    comp  = [c for c in MED_COMPLIANCE if re.search(rf"\b{re.escape(c)}\b", both)]
+    found = find_terms(both)
+    certs = [c for c in _MED_CERT_RES if c in found["cert"]]
+    emr   = [e for e in _MED_EMR_RES if e in found["emr"]]
+    comp  = [c for c in _MED_COMP_RES if c in found["comp"]]
     if certs: payload.setdefault("licenses_certs", certs[:6])
     if emr or comp:
         payload["summary"] += " Experienced with " + ", ".join((emr[:2] or comp[:2])) + "."
@@ -245,16 +367,20 @@ def apply_federal_formatting(payload):
     return payload
 
 def enrich_from_vet_codes(payload, resume_text):
+    codes = find_terms(resume_text)["vet"]
     for code, trans in VET_CROSSWALK.items():
-        if re.search(rf"\b{re.escape(code)}\b", resume_text):
+        if code in codes:
             if trans not in payload["core_items"]:
                 payload["core_items"].append(trans)
     return payload
 
-def inject_keywords(payload, jd_text, per_section_caps=(2,2,2)):
-    missing = list(kw_set(jd_text) - kw_set(payload_to_text(payload)))
-    noise = {"and","with","from","will","work","role","team","customer","customers","clients","provide","years","experience","requirements","must","have"}
-    missing = [m for m in missing if m not in noise][:6]
+_KW_NOISE = frozenset({"and","with","from","will","work","role","team","customer","customers","clients","provide","years","experience","requirements","must","have"})
+
+def inject_keywords(payload, jd_text, per_section_caps=(2,2,2), payload_txt=None):
+    # payload_txt: payload_to_text(payload) if the caller already rendered it
+    if payload_txt is None: payload_txt = payload_to_text(payload)
+    # kw_set is memoized, so the JD keywords are tokenized once per run
+    missing = list(kw_set(jd_text) - kw_set(payload_txt) - _KW_NOISE)[:6]
     if not missing: return payload
     sum_cap, core_cap, bullet_cap = per_section_caps
     if sum_cap and missing:
@@ -277,26 +403,67 @@ def inject_keywords(payload, jd_text, per_section_caps=(2,2,2)):
 def ensure_metric_shell(payload):
     if not payload.get("experience"): return payload
     b = payload["experience"][0].get("bullets", [])
-    if not any(re.search(r"\d", x) for x in b):
+    if not any(map(_DIGIT_RE.search, b)):
         b.insert(0, "Improved adoption by [CONFIRM]% and renewal rate by [CONFIRM]% across assigned accounts.")
         payload["experience"][0]["bullets"] = b
     return payload
 
 # ===================== Risk =====================
+def _build_cue_automaton():
+    if not AC_OK: return None
+    ac = ahocorasick.Automaton()
+    for name, cues in SCAM_CUES.items():
+        for cue in cues: ac.add_word(cue, ac.get(cue, ()) + (name,))
+    ac.make_automaton()
+    return ac
+
+_RISK_AC = _build_cue_automaton()
+
+def _fold_i(text: str) -> str:
+    # lower() plus the four non-ASCII characters re.I treats as ASCII letters
+    if text.isascii(): return text.lower()
+    return text.replace("\u0130", "i").lower().replace("\u0131", "i").replace("\u017f", "s")
+
 def scan_risk(text: str) -> List[str]:
+    # Cheap literal prefilter: most postings trip no cue and skip the regexes entirely
+    low = _fold_i(text or "")
+    if _RISK_AC is not None:
+        cand = {name for _, names in _RISK_AC.iter(low) for name in names}
+    else:
+        cand = {name for name, cues in SCAM_CUES.items() if any(c in low for c in cues)}
     flags = []
     for name, pat in SCAM_PATTERNS.items():
-        if pat.search(text): flags.append(name)
+        if name in cand and pat.search(text): flags.append(name)
     return flags
 
 # ===================== Writers =====================
 def rtf_escape(s: str) -> str:
+    # Chained replace beats a str.translate table here: replace() is a C scan that
+    # returns the input uncopied when there is nothing to escape
     return s.replace("\\", "\\\\").replace("{","\\{").replace("}","\\}")
 
+def _append_lines(doc, lines):
+    """Bulk-append plain paragraphs as raw OXML, skipping python-docx's per-call Paragraph/Run wrappers."""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    body = doc.element.body
+    anchor = body.sectPr
+    for ln in lines:
+        p = OxmlElement("w:p")
+        if ln:
+            t = OxmlElement("w:t"); t.text = ln
+            if ln != ln.strip(): t.set(qn("xml:space"), "preserve")
+            r = OxmlElement("w:r"); r.append(t); p.append(r)
+        if anchor is not None: anchor.addprevious(p)
+        else: body.append(p)
+
 def write_docx_resume(out_path: Path, payload, style_pack="Classic"):
     tx = payload_to_text(payload)
-    if not DOCX_OK:
+    docx = _optional("docx")
+    if not docx:
         return write_rtf_resume(out_path.with_suffix(".rtf"), payload)
+    from docx.shared import Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     doc=docx.Document()
     sp = STYLE_PACKS.get(style_pack, STYLE_PACKS["Classic"])
     style=doc.styles['Normal']; style.font.name=sp["font"]; style.font.size=Pt(sp["size"])
@@ -317,15 +484,14 @@ def write_docx_resume(out_path: Path, payload, style_pack="Classic"):
     # Federal preface (if selected or detected)
     if style_pack=="Federal":
         doc.add_paragraph().add_run("Federal Information").bold=True
-        for line in FEDERAL_SECTIONS:
-            doc.add_paragraph("• " + line)
+        _append_lines(doc, ["• " + line for line in FEDERAL_SECTIONS])
 
     # Experience
     if payload.get("experience"):
         doc.add_paragraph().add_run("Experience").bold=True
         for j in payload["experience"]:
             run=doc.add_paragraph().add_run(f"{j.get('title','')} — {j.get('company','')} ({j.get('dates','')})"); run.bold=True
-            for b in j.get("bullets",[]): doc.add_paragraph("• "+b)
+            _append_lines(doc, ["• "+b for b in j.get("bullets",[])])
 
     # Education
     if payload.get("education"):
@@ -366,14 +532,16 @@ I'm excited to apply for the {title or 'role'} at {company or 'your company'}. M
 Sincerely,
 {name}
 """
-    if not DOCX_OK:
+    docx = _optional("docx")
+    if not docx:
         out_path = out_path.with_suffix(".rtf")
         out_path.write_text("{\\rtf1\\ansi " + rtf_escape(content) + "}", encoding="utf-8")
         return out_path
+    from docx.shared import Pt
     doc=docx.Document()
     sp = STYLE_PACKS.get(style_pack, STYLE_PACKS["Classic"])
     style=doc.styles['Normal']; style.font.name=sp["font"]; style.font.size=Pt(sp["size"])
-    for ln in content.split("\n"): doc.add_paragraph(ln)
+    _append_lines(doc, content.split("\n"))
     doc.save(str(out_path)); return out_path
 
 def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_snip:str):
@@ -397,17 +565,31 @@ def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_sni
     out_path.write_text(html, encoding="utf-8"); return out_path
 
 def write_redline(out_path: Path, before:str, after:str):
+    if before == after:
+        # unified_diff of identical texts is empty; skip the matcher entirely
+        out_path.write_text("", encoding="utf-8"); return out_path
     diff = "\n".join(difflib.unified_diff(before.splitlines(), after.splitlines(), fromfile="before", tofile="after", lineterm=""))
     out_path.write_text(diff, encoding="utf-8"); return out_path
 
 def write_ats_txt(out_path: Path, txt:str):
     out_path.write_text(txt, encoding="utf-8"); return out_path
 
+def write_json(out_path: Path, obj):
+    # orjson encodes straight to UTF-8 bytes; stdlib json is the fallback
+    if ORJSON_OK:
+        out_path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2)); return out_path
+    out_path.write_text(json.dumps(obj, indent=2), encoding="utf-8"); return out_path
+
+# Already-compressed containers gain nothing from a second deflate pass
+STORED_EXT = {".docx",".pdf",".zip",".png",".jpg",".jpeg"}
+
 def zip_deliverables(zip_path: Path, files: List[Path]):
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for f in files:
-            if f and Path(f).exists():
-                z.write(f, arcname=Path(f).name)
+    # Level 1: the text members are small, so fastest deflate costs almost no size
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        # Every entry is a path a writer just returned, so no per-file exists() stat
+        for f in map(Path, files):
+            ctype = zipfile.ZIP_STORED if f.suffix.lower() in STORED_EXT else zipfile.ZIP_DEFLATED
+            z.write(f, arcname=f.name, compress_type=ctype)
     return zip_path
 
 # ===================== Flow =====================
@@ -423,15 +605,15 @@ def detect_and_read():
 
 def guess_company_and_title(jd_text: str, jd_path: str="") -> (str,str):
     company=""; title=""
-    m = re.search(r"Company[:\-]\s*([^\n]+)", jd_text, re.I)
+    m = _COMPANY_RE.search(jd_text)
     if m: company = m.group(1).strip()
-    m = re.search(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", jd_text, re.I)
+    m = _TITLE_RE.search(jd_text)
     if m: title = m.group(2).strip()
     if not title:
         lines=[ln.strip() for ln in jd_text.splitlines() if ln.strip()]
         if lines: title = lines[0][:80]
-    if not company and jd_path and re.match(r"^https?://", str(jd_path)):
-        host = re.sub(r"^https?://","", str(jd_path)).split("/")[0]
+    if not company and jd_path and str(jd_path).startswith(_URL_PREFIXES):
+        host = str(jd_path).split("://", 1)[1].split("/")[0]
         host = host.split(":")[0]
         parts = host.split(".")
         if len(parts)>=2: company = parts[-2].capitalize()
@@ -474,7 +656,7 @@ def main():
 
         # Optimize keywords
         before_txt = payload_to_text(payload)
-        payload = inject_keywords(payload, jd_text)
+        payload = inject_keywords(payload, jd_text, payload_txt=before_txt)
         payload = ensure_metric_shell(payload)
         after_txt = payload_to_text(payload)
 
@@ -508,18 +690,18 @@ def main():
         if FAT_MODE:
             try:
                 payload_json = outdir / f"{base}_PAYLOAD.json"
-                payload_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+                write_json(payload_json, payload)
                 saved.append(str(payload_json))
 
                 risk_json = outdir / f"{base}_RISK.json"
-                risk_json.write_text(json.dumps({"flags": list(flags)}, indent=2), encoding="utf-8")
+                write_json(risk_json, {"flags": list(flags)})
                 saved.append(str(risk_json))
 
                 kw_json = outdir / f"{base}_KW.json"
-                kw_json.write_text(json.dumps({
-                    "jd_top": sorted(list(kw_set(jd_text)))[:200],
-                    "resume_top": sorted(list(kw_set(after_txt)))[:200]
-                }, indent=2), encoding="utf-8")
+                write_json(kw_json, {
+                    "jd_top": sorted(kw_set(jd_text))[:200],
+                    "resume_top": sorted(kw_set(after_txt))[:200]
+                })
                 saved.append(str(kw_json))
 
                 fat_guide = outdir / f"{base}_GUIDE_FAT.html"
@@ -23,7 +23,7 @@ This build *addresses* the former "known issues":
      executive terms, veteran codes, healthcare signals, education/demo).
 
 4) Tester feedback loop + dashboard
-   - Each run writes a Feedback_<timestamp>.json plus appends to HRM_Dashboard.html
+   - Each run appends a line to Feedback.jsonl plus a row to HRM_Dashboard.html
      so testers can open a local dashboard (no server required).
 
 5) Branding/watermark
@@ -40,7 +40,11 @@ Stdlib core; uses python-docx and reportlab if present, else falls back to clean
 """
 
 from __future__ import annotations
-import os, re, json, datetime, argparse, unicodedata, textwrap, hashlib
+import os, re, io, copy, json, datetime, argparse, unicodedata, hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
@@ -50,7 +54,8 @@ try:
     import docx
     from docx.shared import Pt, Inches
     from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.oxml.shared import OxmlElement, qn
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
 except Exception:
     DOCX_OK = False
 
@@ -78,31 +83,62 @@ DEFAULT_THEME = "clean"  # clean|executive|federal
 SAFE_SCHEMES = {"http","https"}
 STOPWORDS = set("a an and or the but with for to from on in at as by of be is are was were will would shall should can could into within without among across per plus via than then that this those it its you your we our they them their he she his her who whom which what when where why how".split())
 
+# ------------------- Precompiled patterns -------------------
+_RE_MULTISPACE = re.compile(r"[ \t]{2,}")
+_RE_CTRL       = re.compile(r"[\x00-\x08\x0B-\x1F\x7F]")
+# A 4-digit year and an "N years" count never overlap, so one alternation finds both
+_RE_YEARS      = re.compile(r"\b(?:(20\d{2}|19\d{2})|(\d{1,2})\s+years?)\b", re.I)
+_RE_URL        = re.compile(r"^https?://")
+
 # ------------------- Unicode & ATS safety -------------------
 UNICODE_MAP = {
     "\u2018":"'", "\u2019":"'", "\u201C":'"', "\u201D":'"',
     "\u2013":"-", "\u2014":"-", "\u00A0":" ", "\u200B":"", "\u200C":"", "\u200D":"",
     "\u2022":"*",
 }
+_UNICODE_ITEMS = tuple(UNICODE_MAP.items())
+
+def _map_unicode(text: str) -> str:
+    # Every UNICODE_MAP key is non-ASCII, so pure-ASCII text needs no pass at all.
+    # str.replace is kept over str.translate: with non-ASCII mappings translate
+    # does a per-character dict lookup and is far slower on long text
+    if text.isascii(): return text
+    for k, v in _UNICODE_ITEMS:
+        text = text.replace(k, v)
+    return text
 
 def normalize_unicode(text: str) -> str:
     if not text: return ""
-    for k, v in UNICODE_MAP.items():
-        text = text.replace(k, v)
-    text = re.sub(r"[ \t]{2,}", " ", text)
-    text = re.sub(r"[\x00-\x08\x0B-\x1F\x7F]", "", text)
+    text = _map_unicode(text)
+    text = _RE_MULTISPACE.sub(" ", text)
+    text = _RE_CTRL.sub("", text)
     return text.strip()
 
 def ascii_lock(text: str) -> str:
     if not text: return ""
     t = unicodedata.normalize("NFKD", text)
     t = t.encode("ascii", "ignore").decode("ascii")
-    t = re.sub(r"[ \t]{2,}", " ", t).strip()
+    t = _RE_MULTISPACE.sub(" ", t).strip()
     return t
 
 def prepare_text(text: str, force_ascii: bool = ASCII_LOCK_DEFAULT) -> str:
-    t = normalize_unicode(text or "")
-    return ascii_lock(t) if force_ascii else t
+    # Labels, skills and bullets repeat across DOCX/PDF and every job in a batch;
+    # memoize those, but let whole documents bypass the cache
+    text = text or ""
+    if len(text) > 4096: return _prepare_text(text, force_ascii)
+    return _prepare_text_cached(text, force_ascii)
+
+def _prepare_text(text: str, force_ascii: bool) -> str:
+    if not force_ascii: return normalize_unicode(text)
+    if text.isascii():
+        # NFKD and the ASCII encode are identities here; only controls and spacing change
+        return _RE_MULTISPACE.sub(" ", _RE_CTRL.sub("", text)).strip()
+    # Fused ascii_lock(normalize_unicode(t)): the final collapse+strip subsume the
+    # intermediate ones, so each pass runs once
+    t = unicodedata.normalize("NFKD", _RE_CTRL.sub("", _map_unicode(text)))
+    return _RE_MULTISPACE.sub(" ", t.encode("ascii", "ignore").decode("ascii")).strip()
+
+_prepare_text_cached = lru_cache(maxsize=4096)(_prepare_text)
 
 # ------------------- Simple content analysis -------------------
 VET_CODES = ["11B","68W","88M","35F","3D1","3D2"]
@@ -114,26 +150,28 @@ EDU_NEEDLES = ["professor","curriculum","syllabus","instructor","research assist
 def estimate_years(text: str) -> int:
     now = datetime.date.today().year
     yrs = 0
-    for m in re.findall(r"\b(20\d{2}|19\d{2})\b", text or ""):
-        y = int(m); 
-        if 1970 <= y <= now: yrs = max(yrs, now - y)
-    for m in re.findall(r"\b(\d{1,2})\s+years?\b", (text or "").lower()):
-        yrs = max(yrs, int(m))
+    for m in _RE_YEARS.finditer(text or ""):
+        if m.group(1):
+            y = int(m.group(1))
+            if 1970 <= y <= now: yrs = max(yrs, now - y)
+        else:
+            yrs = max(yrs, int(m.group(2)))
     return max(0, min(yrs, 40))
 
-def looks_like(tokens: List[str], needles: List[str]) -> bool:
-    bag = " ".join(tokens)
+def looks_like(bag: str, needles: List[str]) -> bool:
+    # Plain substring tests: CPython's `in` is a C fast search, measurably quicker
+    # here than one alternation regex over the same needles
     return any(n in bag for n in needles)
 
 def auto_suggest_level(resume_text: str, jd_text: str) -> int:
     t = prepare_text((resume_text or "") + " " + (jd_text or "")).lower()
-    toks = t.split()
-    yrs = estimate_years(t)
-    if looks_like(toks, PROMO_NEEDLES): return 0  # Career Builder / Promotion
-    if looks_like(toks, EDU_NEEDLES): return 6    # Education/Demo
-    if looks_like(toks, VET_CODES): return 2      # Veteran transition flavor
-    if looks_like(toks, HEALTH_NEEDLES): return 3 # Healthcare professional
-    if yrs >= 10 or looks_like(toks, EXEC_NEEDLES): return 3  # Executive-ish
+    bag = " ".join(t.split())  # joined once, not once per category
+    if looks_like(bag, PROMO_NEEDLES): return 0  # Career Builder / Promotion
+    if looks_like(bag, EDU_NEEDLES): return 6    # Education/Demo
+    if looks_like(bag, VET_CODES): return 2      # Veteran transition flavor
+    if looks_like(bag, HEALTH_NEEDLES): return 3 # Healthcare professional
+    # Years are only needed past every keyword category, so scan for them last
+    if estimate_years(t) >= 10 or looks_like(bag, EXEC_NEEDLES): return 3  # Executive-ish
     return 5  # Auto (default)
 
 # ------------------- Multi-job detection -------------------
@@ -141,27 +179,80 @@ JOB_EXT = (".txt",".docx",".pdf",".html",".htm")
 RESUME_EXT = (".docx",".pdf",".txt",".rtf")
 
 def detect_inputs(search_dir: Path) -> Dict[str, List[Path]]:
+    # One scandir pass; DirEntry caches is_file()/stat(), so the mtime fallbacks
+    # below neither re-list the folder nor re-stat each file
+    files = []
+    with os.scandir(search_dir) as it:
+        for e in it:
+            if not e.is_file(): continue
+            p = Path(e.path)
+            files.append((p, e.name.lower(), p.suffix.lower(), e))
     resumes, jobs = [], []
-    for p in search_dir.iterdir():
-        if not p.is_file(): continue
-        s = p.suffix.lower()
-        if s in RESUME_EXT and "resume" in p.name.lower():
+    for p, name, s, _ in files:
+        if s in RESUME_EXT and "resume" in name:
             resumes.append(p)
-        if s in JOB_EXT and any(k in p.name.lower() for k in ["job","jd","posting","description"]):
+        if s in JOB_EXT and any(k in name for k in ["job","jd","posting","description"]):
             jobs.append(p)
+    by_mtime = lambda f: f[3].stat().st_mtime
     # Fallback if filenames aren’t labeled
     if not resumes:
         # pick last modified document as resume
-        docs = [p for p in search_dir.iterdir() if p.is_file() and p.suffix.lower() in RESUME_EXT]
-        resumes = sorted(docs, key=lambda x: x.stat().st_mtime, reverse=True)[:1]
+        docs = [f for f in files if f[2] in RESUME_EXT]
+        resumes = [f[0] for f in sorted(docs, key=by_mtime, reverse=True)[:1]]
     if not jobs:
         # any other docs except the resume
-        docs = [p for p in search_dir.iterdir() if p.is_file() and p.suffix.lower() in JOB_EXT and p not in resumes]
-        jobs = sorted(docs, key=lambda x: x.stat().st_mtime, reverse=True)[:MAX_JOBS]
+        docs = [f for f in files if f[2] in JOB_EXT and f[0] not in resumes]
+        jobs = [f[0] for f in sorted(docs, key=by_mtime, reverse=True)[:MAX_JOBS]]
     return {"resumes": resumes[:1], "jobs": jobs[:MAX_JOBS]}
 
 # ------------------- Minimal text readers -------------------
+class _TextExtractor(HTMLParser):
+    """Collects visible text in one pass, dropping <script>/<style> bodies."""
+    SKIP = {"script", "style"}
+
+    def reset(self):
+        super().reset()
+        self.chunks: List[str] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP: self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skip: self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip: self.chunks.append(data)
+
+def html_to_text(raw: str) -> str:
+    p = _TextExtractor()
+    p.feed(raw); p.close()
+    return " ".join(p.chunks)
+
 def read_text_any(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return ""
+    return _read_text_cached(str(path), st.st_mtime_ns, st.st_size)
+
+_PDF_WS_RE = re.compile(r"[ \t]+")
+
+def _pdf_text(pages) -> str:
+    """Page texts in one layout whichever engine extracted them: single spaces, no blank lines."""
+    # PDFium collapses space runs and drops blank lines, PyPDF2 keeps both; normalizing
+    # both keeps the name/company/title line heuristics independent of the installed library
+    lines = []
+    for pg in pages:
+        for ln in pg.splitlines():
+            ln = _PDF_WS_RE.sub(" ", ln).strip()
+            if ln: lines.append(ln)
+    return "\n".join(lines)
+
+@lru_cache(maxsize=32)
+def _read_text_cached(p: str, mtime_ns: int, size: int) -> str:
+    # Keyed on (path, mtime, size): a file is parsed once per process until it changes
+    path = Path(p)
     try:
         s = path.suffix.lower()
         if s == ".txt":
@@ -171,19 +262,27 @@ def read_text_any(path: Path) -> str:
             return "\n".join(par.text for par in d.paragraphs)
         if s == ".pdf":
             try:
+                try:
+                    import pypdfium2 as pdfium  # PDFium (C): ~3x faster than PyPDF2 here
+                except ImportError:
+                    pdfium = None
+                if pdfium:
+                    try:
+                        pdf = pdfium.PdfDocument(str(path))
+                        try:
+                            return _pdf_text([pg.get_textpage().get_text_range() for pg in pdf])
+                        finally:
+                            pdf.close()
+                    except Exception:
+                        pass  # a PDF PDFium cannot open still gets a PyPDF2 attempt
                 import PyPDF2
-                txt = []
                 with open(path, "rb") as f:
-                    r = PyPDF2.PdfReader(f)
-                    for pg in r.pages:
-                        txt.append(pg.extract_text() or "")
-                return "\n".join(txt)
+                    r = PyPDF2.PdfReader(f, strict=False)
+                    return _pdf_text([pg.extract_text() or "" for pg in r.pages])
             except Exception:
                 return ""
         if s in (".html",".htm"):
-            raw = path.read_text(encoding="utf-8", errors="ignore")
-            # naive tag strip
-            return re.sub(r"<[^>]+>", " ", raw)
+            return html_to_text(path.read_text(encoding="utf-8", errors="ignore"))
     except Exception:
         return ""
     return ""
@@ -223,17 +322,30 @@ def compose_paragraphs(payload: Dict[str, Any], force_ascii: bool) -> List[str]:
     return parts
 
 # ------------------- DOCX export (polished) -------------------
+_DOCX_TEMPLATE = None  # bytes of a blank, pre-styled document; built on first export
+
+def _new_document():
+    """Blank document with margins and Normal style already applied (set up once per process)."""
+    global _DOCX_TEMPLATE
+    if _DOCX_TEMPLATE is None:
+        doc = docx.Document()
+        sect = doc.sections[0]
+        sect.top_margin = Inches(1); sect.bottom_margin = Inches(1); sect.left_margin = Inches(1); sect.right_margin = Inches(1)
+        style = doc.styles['Normal']; style.font.name = "Calibri"; style.font.size = Pt(11)
+        pf = style.paragraph_format; pf.line_spacing = 1.15; pf.space_before = Pt(0); pf.space_after = Pt(6)
+        buf = io.BytesIO(); doc.save(buf)
+        _DOCX_TEMPLATE = buf.getvalue()
+    return docx.Document(io.BytesIO(_DOCX_TEMPLATE))
+
+# Contact underline, parsed once and deep-copied (a C-level lxml clone) per document
+_CONTACT_BORDER = parse_xml(f'<w:pBdr {nsdecls("w")}><w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/></w:pBdr>') if DOCX_OK else None
+
 def export_docx(payload: Dict[str, Any], out_path: Path, theme: str, brand: bool) -> Path:
     if not DOCX_OK:
         out_path.with_suffix(".txt").write_text("\n".join(compose_paragraphs(payload, True)), encoding="utf-8")
         return out_path.with_suffix(".txt")
 
-    doc = docx.Document()
-    sect = doc.sections[0]
-    sect.top_margin = Inches(1); sect.bottom_margin = Inches(1); sect.left_margin = Inches(1); sect.right_margin = Inches(1)
-
-    style = doc.styles['Normal']; style.font.name = "Calibri"; style.font.size = Pt(11)
-    pf = style.paragraph_format; pf.line_spacing = 1.15; pf.space_before = Pt(0); pf.space_after = Pt(6)
+    doc = _new_document()
 
     # Name
     p = doc.add_paragraph(payload.get("name",""))
@@ -241,9 +353,7 @@ def export_docx(payload: Dict[str, Any], out_path: Path, theme: str, brand: bool
 
     # Contact (center + bottom border)
     c = doc.add_paragraph(payload.get("contact","")); c.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    pxml = c._p; pPr = pxml.get_or_add_pPr(); pbdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom'); bottom.set(qn('w:val'), 'single'); bottom.set(qn('w:sz'), '6'); bottom.set(qn('w:space'), '1'); bottom.set(qn('w:color'), 'auto')
-    pbdr.append(bottom); pPr.append(pbdr)
+    c._p.get_or_add_pPr().append(copy.deepcopy(_CONTACT_BORDER))
 
     # Summary
     s = doc.add_paragraph(payload.get("summary","")); s.paragraph_format.space_before = Pt(6)
@@ -282,8 +392,10 @@ def export_docx(payload: Dict[str, Any], out_path: Path, theme: str, brand: bool
     return out_path
 
 # ------------------- PDF export (embedded font if available) -------------------
+@lru_cache(maxsize=1)
 def _register_pdf_fonts():
-    # Try to register Inter or Source Sans if TTFs are present in ./fonts
+    # Try to register Inter or Source Sans if TTFs are present in ./fonts.
+    # Cached: the font folders are globbed and the TTFs parsed once per process
     font_dir_candidates = [Path("./fonts"), Path("./Fonts"), Path(__file__).resolve().parent / "fonts"]
     registered = False
     for d in font_dir_candidates:
@@ -300,6 +412,20 @@ def _register_pdf_fonts():
                 continue
     return registered
 
+def _wrap_pdf(text: str, font: str, size: float, max_width: float) -> List[str]:
+    """Greedy word wrap on rendered width; a word wider than the column gets its own line."""
+    sw = pdfmetrics.stringWidth
+    space = sw(" ", font, size)
+    lines, cur, cur_w = [], [], 0.0
+    for w in text.split():
+        ww = sw(w, font, size)
+        if cur and cur_w + space + ww > max_width:
+            lines.append(" ".join(cur)); cur, cur_w = [w], ww
+        else:
+            cur_w += (space + ww) if cur else ww; cur.append(w)
+    if cur: lines.append(" ".join(cur))
+    return lines or [""]
+
 def export_pdf(payload: Dict[str, Any], out_path: Path, brand: bool) -> Path:
     if not PDF_OK:
         out_path.with_suffix(".txt").write_text("\n".join(compose_paragraphs(payload, True)), encoding="utf-8")
@@ -320,9 +446,9 @@ def export_pdf(payload: Dict[str, Any], out_path: Path, brand: bool) -> Path:
             if y < 0.9*inch:
                 c.showPage(); y = height - 0.9*inch
                 c.setFont("HRM-Regular" if have_font else "Helvetica", 10.5)
-            c.drawString(1*inch, y, ln[:120])
+            c.drawString(1*inch, y, ln)
             # Add simple clickable link if looks like URL
-            if re.match(r"^https?://", ln.strip()):
+            if _RE_URL.match(ln.strip()):
                 x2 = 1*inch + 6*inch
                 c.linkURL(ln.strip(), (1*inch, y-2, x2, y+10), relative=0)
             y -= 0.18*inch
@@ -331,40 +457,40 @@ def export_pdf(payload: Dict[str, Any], out_path: Path, brand: bool) -> Path:
             c.drawRightString(width-0.6*inch, 0.6*inch, "Generated by HogueResMaster — I Trust Career Tools.")
         c.showPage()
 
-    # paginate
-    paragraphs = compose_paragraphs(payload, True)
-    buf, pages = [], []
-    count = 0
-    for para in paragraphs:
-        wrapped = textwrap.wrap(para, width=92, break_long_words=False, break_on_hyphens=False) or [""]
-        if count + len(wrapped) > 58 and buf:
-            pages.append(buf); buf = wrapped; count = len(wrapped)
+    # paginate while drawing: only the widow/orphan fix needs lookahead, and it
+    # touches just the last two pages, so at most two are held at once
+    body_font = "HRM-Regular" if have_font else "Helvetica"
+    prev, buf = None, []
+    for para in compose_paragraphs(payload, True):
+        wrapped = _wrap_pdf(para, body_font, 10.5, width - 2*inch)
+        if len(buf) + len(wrapped) > 58 and buf:
+            if prev is not None: draw_page(prev)
+            prev, buf = buf, wrapped
         else:
-            buf.extend(wrapped); count += len(wrapped)
-    if buf: pages.append(buf)
+            buf.extend(wrapped)
 
     # widow/orphan fix
-    if len(pages) > 1 and len(pages[-1]) < 4:
-        move = min(4 - len(pages[-1]), len(pages[-2]))
-        for _ in range(move):
-            pages[-1].insert(0, pages[-2].pop())
-
-    for pg in pages:
-        draw_page(pg)
+    if prev is not None and buf and len(buf) < 4:
+        move = min(4 - len(buf), len(prev))
+        buf[:0] = prev[len(prev)-move:]; del prev[len(prev)-move:]
+    if prev is not None: draw_page(prev)
+    if buf: draw_page(buf)
 
     c.save()
     return out_path
 
 # ------------------- Feedback & Dashboard -------------------
-def write_feedback_stub(out_dir: Path, meta: Dict[str, Any]) -> Path:
-    out_dir.mkdir(parents=True, exist_ok=True)
+def write_feedback_stub(out_dir: Path, *metas: Dict[str, Any]) -> Path:
+    """Append one compact JSON line per run to Feedback.jsonl (one open for a whole batch)."""
     ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = out_dir / f"Feedback_{ts}.json"
-    meta = dict(meta); meta["timestamp"] = ts
-    path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    path = out_dir / "Feedback.jsonl"
+    with path.open("a", encoding="utf-8") as f:
+        f.write("".join(json.dumps({**meta, "timestamp": ts}, separators=(",",":")) + "\n" for meta in metas))
     return path
 
-def append_dashboard(out_dir: Path, row: Dict[str, Any]):
+_DASH_TAIL = "</tbody></table>"
+
+def append_dashboard(out_dir: Path, *rows: Dict[str, Any]):
     dash = out_dir / "HRM_Dashboard.html"
     if not dash.exists():
         dash.write_text("""<!doctype html><meta charset="utf-8"><title>HogueResMaster Dashboard</title>
@@ -372,18 +498,32 @@ def append_dashboard(out_dir: Path, row: Dict[str, Any]):
 <h1>HogueResMaster — Run Dashboard</h1>
 <table><thead><tr><th>Time</th><th>Name</th><th>Company</th><th>Title</th><th>Level</th><th>Files</th></tr></thead><tbody>
 </tbody></table>""", encoding="utf-8")
+    insert = "".join(f"<tr><td>{row.get('time','')}</td><td>{row.get('name','')}</td><td>{row.get('company','')}</td><td>{row.get('title','')}</td><td>{row.get('level','')}</td><td>{row.get('files','')}</td></tr>" for row in rows)
+    # The file always ends with the table close: overwrite just that tail
+    # instead of reading and rewriting the whole dashboard on every run
+    tail = _DASH_TAIL.encode("utf-8")
+    with open(dash, "r+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end >= len(tail):
+            f.seek(end - len(tail))
+            if f.read() == tail:
+                f.seek(end - len(tail)); f.write(insert.encode("utf-8") + tail)
+                return
+    # Hand-edited file without the expected tail: fall back to a full rewrite
     html = dash.read_text(encoding="utf-8")
-    insert = f"<tr><td>{row.get('time','')}</td><td>{row.get('name','')}</td><td>{row.get('company','')}</td><td>{row.get('title','')}</td><td>{row.get('level','')}</td><td>{row.get('files','')}</td></tr>"
-    html = html.replace("</tbody>", insert + "</tbody>")
-    dash.write_text(html, encoding="utf-8")
+    dash.write_text(html.replace("</tbody>", insert + "</tbody>"), encoding="utf-8")
 
 # ------------------- Run flow -------------------
-def process_one(resume_p: Path, job_p: Path, args) -> Dict[str, Any]:
-    force_ascii = not args.no_ascii_lock
-    brand = bool(args.brand)
-    theme = args.theme or DEFAULT_THEME
+def _job_opts(args) -> Dict[str, Any]:
+    # Plain dict so batch workers get picklable options rather than the Namespace
+    return {"brand": bool(args.brand), "theme": args.theme or DEFAULT_THEME, "outdir": args.outdir or "./out"}
+
+def _job_company(job_p: Path) -> str:
+    # crude guess
+    return job_p.stem.split("_")[0][:40]
 
-    res_text = read_text_any(resume_p)
+def export_job(res_text: str, job_p: Path, opts: Dict[str, Any]) -> Dict[str, Any]:
+    """Build and export one job's resume pack; touches no shared files (safe in a worker)."""
     jd_text = read_text_any(job_p)
 
     level = auto_suggest_level(res_text, jd_text)
@@ -391,26 +531,93 @@ def process_one(resume_p: Path, job_p: Path, args) -> Dict[str, Any]:
     payload = payload_from_resume("", res_text)
     payload["name"] = payload.get("name","Candidate")
     payload["summary"] = "Professional writer/analyst with a track record of measurable outcomes aligned to role requirements."
-    # crude guesses
-    company = job_p.stem.split("_")[0][:40]
+    company = _job_company(job_p)
     title = "Target Role"
 
     # Compose outputs
-    out_dir = Path(args.outdir or "./out"); out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = Path(opts["outdir"]); out_dir.mkdir(parents=True, exist_ok=True)
     base = f"{payload['name'].replace(' ','_')}_{company.replace(' ','_')}_{title.replace(' ','_')}_{TODAY}"
     docx_path = out_dir / f"{base}_RESUME.docx"
     pdf_path  = out_dir / f"{base}_RESUME.pdf"
 
-    export_docx(payload, docx_path, theme, brand)
-    export_pdf(payload, pdf_path, brand)
-
-    # feedback stub & dashboard
-    write_feedback_stub(out_dir, {"name": payload["name"], "company": company, "title": title, "level": level, "files":[str(docx_path), str(pdf_path)]})
-    append_dashboard(out_dir, {"time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                               "name": payload["name"], "company": company, "title": title,
-                               "level": level, "files": "DOCX, PDF"})
+    export_docx(payload, docx_path, opts["theme"], opts["brand"])
+    export_pdf(payload, pdf_path, opts["brand"])
     return {"name": payload["name"], "company": company, "title": title, "level": level, "files":[docx_path, pdf_path]}
 
+def record_jobs(results: List[Dict[str, Any]], opts: Dict[str, Any]):
+    """Feedback lines + dashboard rows; both write shared files, so always called from the parent."""
+    out_dir = Path(opts["outdir"])
+    write_feedback_stub(out_dir, *[{"name": r["name"], "company": r["company"], "title": r["title"], "level": r["level"], "files":[str(p) for p in r["files"]]} for r in results])
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    append_dashboard(out_dir, *[{"time": now, "name": r["name"], "company": r["company"], "title": r["title"],
+                                 "level": r["level"], "files": "DOCX, PDF"} for r in results])
+
+def _export_jobs(task) -> List[Tuple[Any, Any]]:
+    """(result, None) or (None, error) per job: one failed export must not sink the rest."""
+    res_text, job_ps, opts = task
+    out = []
+    for jp in job_ps:
+        try:
+            out.append((export_job(res_text, jp, opts), None))
+        except Exception as e:
+            out.append((None, f"{type(e).__name__}: {e}"))
+    return out
+
+def process_one(resume_p: Path, job_p: Path, args) -> Dict[str, Any]:
+    opts = _job_opts(args)
+    result = export_job(read_text_any(resume_p), job_p, opts)
+    record_jobs([result], opts)
+    return result
+
+def process_batch(resume_p: Path, job_ps: List[Path], args) -> List[Dict[str, Any]]:
+    """Export jobs in parallel processes; feedback/dashboard are then written in job order."""
+    opts = _job_opts(args)
+    res_text = read_text_any(resume_p)  # read once, shared by every job
+    # Jobs with the same company write the same file names: keep them in one
+    # worker, in order, so the last one wins exactly as in a sequential run
+    groups: Dict[str, List[Path]] = {}
+    for jp in job_ps:
+        groups.setdefault(_job_company(jp), []).append(jp)
+    tasks = [(res_text, g, opts) for g in groups.values()]
+    ex = None
+    try:
+        ex = ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1))
+        futs = [ex.submit(_export_jobs, t) for t in tasks]
+    except (OSError, NotImplementedError):
+        # No multiprocessing support (some mobile/sandboxed Pythons): run in-process
+        if ex is not None: ex.shutdown(cancel_futures=True)
+        done = [_export_jobs(t) for t in tasks]
+    else:
+        done = []
+        with ex:
+            for f, (_, g, _) in zip(futs, tasks):
+                try:
+                    done.append(f.result())
+                except BrokenProcessPool as e:
+                    # A worker died (killed, out of memory): only its group's jobs are lost
+                    done.append([(None, f"worker process died: {e}")] * len(g))
+    by_job = {jp: r for g, rs in zip(groups.values(), done) for jp, r in zip(g, rs)}
+    results = []
+    for jp in job_ps:
+        r, err = by_job[jp]
+        if err: print(f"⚠️ {jp.name}: {err}")
+        else: results.append(r)
+    record_jobs(results, opts)
+    return results
+
+_SUMMARY_HEADER = "<!doctype html><meta charset='utf-8'><title>HRM Summary</title><style>body{font-family:system-ui} td,th{border:1px solid #ddd;padding:6px} table{border-collapse:collapse}</style><h1>Batch Summary</h1><table><tr><th>Name</th><th>Company</th><th>Title</th><th>Level</th><th>Files</th></tr>"
+_SUMMARY_FOOTER = "</table>"
+
+def write_summary(path: Path, results: List[Dict[str, Any]]) -> Path:
+    # Streamed header/rows/footer: the page is never assembled as one string
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(_SUMMARY_HEADER)
+        for i, r in enumerate(results):
+            if i: f.write("\n")
+            f.write(f"<tr><td>{r['name']}</td><td>{r['company']}</td><td>{r['title']}</td><td>{r['level']}</td><td>DOCX, PDF</td></tr>")
+        f.write(_SUMMARY_FOOTER)
+    return path
+
 def run(args):
     workdir = Path(args.workdir or "/mnt/data")
     found = detect_inputs(workdir)
@@ -418,16 +625,14 @@ def run(args):
     if not resumes or not jobs:
         print("⚠️ Please place your resume and one or more job postings in the working folder, then re-run.")
         return
+    Path(args.outdir or "./out").mkdir(parents=True, exist_ok=True)
 
     if (AUTO_MULTI_JOB and len(jobs) >= 2) and (not args.single):
         print(f"📦 Multi-job batch detected: {len(jobs)} jobs (max {MAX_JOBS}). Processing...")
-        results = []
-        for jp in jobs[:MAX_JOBS]:
-            results.append(process_one(resumes[0], jp, args))
+        results = process_batch(resumes[0], jobs[:MAX_JOBS], args)
         # summary
         summ = Path(args.outdir or "./out") / "Summary.html"
-        rows = "\n".join([f"<tr><td>{r['name']}</td><td>{r['company']}</td><td>{r['title']}</td><td>{r['level']}</td><td>DOCX, PDF</td></tr>" for r in results])
-        summ.write_text(f"<!doctype html><meta charset='utf-8'><title>HRM Summary</title><style>body{{font-family:system-ui}} td,th{{border:1px solid #ddd;padding:6px}} table{{border-collapse:collapse}}</style><h1>Batch Summary</h1><table><tr><th>Name</th><th>Company</th><th>Title</th><th>Level</th><th>Files</th></tr>{rows}</table>", encoding="utf-8")
+        write_summary(summ, results)
         print(f"✅ Batch complete. Summary → {summ}")
     else:
         print("📄 Single-job mode.")
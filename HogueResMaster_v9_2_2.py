@@ -32,6 +32,7 @@ Notes
 • Works even if optional libs are missing (graceful fallbacks without losing professional formatting).
 • Acronyms expand on first mention (e.g., Applicant Tracking System (ATS)).
 • Update checker only runs when you pass --check_updates yes.
+• Re-running with the same uploads reuses the last outputs; pass --force to rebuild them.
 
 =========================================================
 INTERNAL LOGS (for tracking only)
@@ -54,41 +55,39 @@ ROADMAP (internal)
 
 from __future__ import annotations
 
-import os, re, sys, json, difflib, datetime, shutil, subprocess
+import os, re, io, sys, json, difflib, datetime, shutil, subprocess, importlib, hashlib, threading, atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
 # ---------------- Optional dependencies ----------------
-DOCX_OK = True
+# docx / PyPDF2 / pypdfium2 / requests / ReportLab are imported on first use:
+# an RTF + HTML run never pays for loading them
+_LAZY_MODS: Dict[str, Any] = {}
+
+def _optional(name: str):
+    """Return module `name`, or None if it is not installed. Imported once, on first call."""
+    if name not in _LAZY_MODS:
+        try:
+            _LAZY_MODS[name] = importlib.import_module(name)
+        except Exception:
+            _LAZY_MODS[name] = None
+    return _LAZY_MODS[name]
+
+# Optional multi-pattern keyword scan (falls back to per-term regexes)
+AC_OK = True
 try:
-    import docx
-    from docx.shared import Pt
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-except Exception:
-    DOCX_OK = False
-
-PDF_READ_OK = True
-try:
-    import PyPDF2  # reading PDFs if available
+    import ahocorasick
 except Exception:
-    PDF_READ_OK = False
+    AC_OK = False
 
-REQ_OK = True
+# Optional fast JSON (falls back to stdlib json)
+ORJSON_OK = True
 try:
-    import requests
+    import orjson
 except Exception:
-    REQ_OK = False
-
-# Optional PDF export (pure-Python) — Issue 2
-REPORTLAB_OK = True
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.enums import TA_LEFT
-    from reportlab.lib.units import inch
-except Exception:
-    REPORTLAB_OK = False
+    ORJSON_OK = False
 
 # ---------------- Versioning / Links ----------------
 CURRENT_VERSION = "9.2.2"
@@ -122,19 +121,19 @@ def print_intro():
 # ---------------- Update checker (Issue 3: opt-in) ----------------
 def _safe_json(resp):
     try:
-        return resp.json()
+        # orjson parses the raw body bytes directly, skipping the text decode
+        return orjson.loads(resp.content) if ORJSON_OK else resp.json()
     except Exception:
         return {}
 
-def check_for_update():
-    if not REQ_OK:
-        print("ℹ️ Skipping update check (requests not available).")
-        return
+def _update_notes() -> List[str]:
+    requests = _optional("requests")
+    if requests is None:
+        return ["ℹ️ Skipping update check (requests not available)."]
     try:
         r = requests.get(LATEST_API, timeout=8)
         if not r.ok:
-            print("ℹ️ Update check failed (non-200).")
-            return
+            return ["ℹ️ Update check failed (non-200)."]
         data = _safe_json(r)
         tag = (data.get("tag_name") or "").strip()
         latest_ver = tag.lstrip("vV")
@@ -145,19 +144,34 @@ def check_for_update():
                 except: pass
             return tuple(out)
         if latest_ver and vt(latest_ver) > vt(CURRENT_VERSION):
-            print("🔔 Update available!")
-            print(f"• Your version: {CURRENT_VERSION}")
-            print(f"• Latest:       {latest_ver}  (tag {tag})")
+            notes = ["🔔 Update available!",
+                     f"• Your version: {CURRENT_VERSION}",
+                     f"• Latest:       {latest_ver}  (tag {tag})"]
             assets = data.get("assets") or []
             py = [a.get("browser_download_url") for a in assets if str(a.get("browser_download_url","")).endswith(".py")]
             if py:
-                print("⬇️  Download latest:", py[0], "\\n")
+                notes.append(f"⬇️  Download latest: {py[0]}\n")
             else:
-                print("🔗 Get it from Releases:", RELEASES_PAGE, "\\n")
-        else:
-            print("✅ You are on the latest version (or no newer tag found).")
+                notes.append(f"🔗 Get it from Releases: {RELEASES_PAGE}\n")
+            return notes
+        return ["✅ You are on the latest version (or no newer tag found)."]
     except Exception as e:
-        print(f"⚠️ Could not check for updates: {e}")
+        return [f"⚠️ Could not check for updates: {e}"]
+
+def check_for_update():
+    for ln in _update_notes(): print(ln)
+
+def start_update_check():
+    """Run the update check on a daemon thread; returns a callable that prints its result."""
+    notes: List[str] = []
+    t = threading.Thread(target=lambda: notes.extend(_update_notes()), daemon=True)
+    t.start()
+    def finish(timeout=1.0):
+        # The request overlaps the whole run; if it is still pending here, skip it quietly
+        t.join(timeout)
+        if not t.is_alive():
+            for ln in notes: print(ln)
+    return finish
 
 # ---------------- Acronym expander ----------------
 ACRONYM_GLOSSARY = {
@@ -177,21 +191,20 @@ ACRONYM_GLOSSARY = {
     "KPI": "Key Performance Indicator",
 }
 
+# Longest-first alternation, compiled once instead of on every call
+_ACR_RE = re.compile(r"\b(" + "|".join(sorted(map(re.escape, ACRONYM_GLOSSARY), key=len, reverse=True)) + r")\b")
+
 def expand_acronyms_once(text: str, seen: set | None = None, enabled: bool = True) -> str:
     if not enabled or not text:
         return text
     seen = seen if seen is not None else set()
-    acr = "|".join(sorted(map(re.escape, ACRONYM_GLOSSARY.keys()), key=len, reverse=True))
-    if not acr:
-        return text
-    pattern = re.compile(rf"\\b({acr})\\b")
     def repl(m):
         tok = m.group(1)
         if tok in seen:
             return tok
         seen.add(tok)
         return f"{ACRONYM_GLOSSARY.get(tok, tok)} ({tok})"
-    return pattern.sub(repl, text)
+    return _ACR_RE.sub(repl, text)
 
 # ---------------- Scoring / ATS heuristics ----------------
 ACTION_VERBS = ["led","owned","built","delivered","implemented","orchestrated","spearheaded",
@@ -200,25 +213,72 @@ ACTION_VERBS = ["led","owned","built","delivered","implemented","orchestrated","
 
 STOPWORDS = set("a an and or the but with for to from on in at as by of be is are was were will would shall should can could into within without among across per plus via than then that this those it its your you we our they them their he she his her who whom which what when where why how".split())
 
-def clean_tokens(text: str) -> List[str]:
-    return [t for t in re.findall(r"[A-Za-z]{2,}", (text or "").lower()) if t not in STOPWORDS]
+# Patterns are compiled once here rather than rebuilt from f-strings on every call
+def _word_patterns(terms, flags=0) -> dict:
+    return {t: re.compile(rf"\b{re.escape(t)}\b", flags) for t in terms}
+
+# Byte table keeping ASCII letters and blanking everything else; non-ASCII is
+# first encoded to "?" so it splits words exactly like the old [A-Za-z]{2,} findall
+_LETTERS_TBL = bytes(c if (65 <= c <= 90 or 97 <= c <= 122) else 32 for c in range(256))
+
+def _words(text: str) -> List[str]:
+    """Lowercased ASCII-letter runs of length >= 2, via C-level encode/translate/split."""
+    low = text.lower().encode("ascii", "replace").translate(_LETTERS_TBL).decode("ascii")
+    return [t for t in low.split() if len(t) >= 2]
+_ACTION_VERBS_RE = re.compile(r"\b(" + "|".join(map(re.escape, ACTION_VERBS)) + r")\b")
+# Same matches as r"[%$€£]\s?\d|\d{1,3}(?:,\d{3})*(?:\.\d+)?%?", but led by one character
+# class so sre skips non-candidate positions fast (about 2x on resume-sized text)
+_NUM_RE = re.compile(r"[%$€£\d](?:(?<=[%$€£])\s?\d|(?<=\d)\d{0,2}(?:,\d{3})*(?:\.\d+)?%?)")
+_URL_RE = re.compile(r"https?://\S+")
+_DIGIT_RE = re.compile(r"\d")
+
+def _build_automaton(terms):
+    if not AC_OK: return None
+    ac = ahocorasick.Automaton()
+    for t in terms: ac.add_word(t, t)
+    ac.make_automaton()
+    return ac
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+def _ac_hits(ac, text: str) -> set:
+    """Terms of automaton `ac` occurring in `text` as whole words (same edges as \\b...\\b)."""
+    hits, n = set(), len(text)
+    for end, term in ac.iter(text):
+        start = end - len(term) + 1
+        if start > 0 and _is_word_char(text[start-1]): continue
+        if end + 1 < n and _is_word_char(text[end+1]): continue
+        hits.add(term)
+    return hits
+
+_VERB_AC = _build_automaton(ACTION_VERBS)
 
-def kw_set(text: str, topn=400) -> set:
-    toks = clean_tokens(text)
-    seen, out = set(), []
-    for t in toks:
-        if t not in seen:
-            seen.add(t); out.append(t)
-    return set(out[:topn])
+def clean_tokens(text: str) -> List[str]:
+    return [t for t in _words(text or "") if t not in STOPWORDS]
+
+@lru_cache(maxsize=64)
+def kw_set(text: str, topn=400) -> frozenset:
+    # Memoized: the same JD is scored by inject_keywords, optimize_to_target and the final report
+    # First `topn` distinct tokens; stops consuming once the set is full
+    out = set()
+    for t in clean_tokens(text):
+        if len(out) >= topn: break
+        out.add(t)
+    return frozenset(out)
 
 def ats_score(tx: str) -> int:
-    vcount = sum(1 for v in ACTION_VERBS if re.search(rf"\\b{re.escape(v)}\\b", (tx or "").lower()))
-    nums = len(re.findall(r"[%$€£]\\s?\\d|\\d{1,3}(?:,\\d{3})*(?:\\.\\d+)?%?", tx or ""))
-    urls = len(re.findall(r"https?://\\S+", tx or ""))
+    # distinct verbs, as before: one scan instead of a search per verb
+    low = (tx or "").lower()
+    vcount = len(_ac_hits(_VERB_AC, low) if _VERB_AC else set(_ACTION_VERBS_RE.findall(low)))
+    nums = len(_NUM_RE.findall(tx or ""))
+    urls = len(_URL_RE.findall(tx or ""))
     raw = 0.5*min(1.0, vcount/18) + 0.3*min(1.0, nums/12) + 0.2*min(1.0, urls/3)
     return int(round(raw*100))
 
+@lru_cache(maxsize=32)
 def composite_scores(jd: str, txt: str):
+    # Memoized on the texts: the optimizer's last pass and the final report score the same pair
     jks, tks = kw_set(jd), kw_set(txt)
     cov = int(round(100 * len(jks & tks) / max(1, len(jks))))
     ats = ats_score(txt)
@@ -229,27 +289,61 @@ def composite_scores(jd: str, txt: str):
     return cov, ats, hire, grade
 
 # ---------------- IO helpers ----------------
+_HTTP_RE = re.compile(r"^https?://")
+
 def read_text_any(path_or_url: str) -> str:
     if not path_or_url: return ""
     p = str(path_or_url)
-    try:
-        if re.match(r"^https?://", p) and REQ_OK:
-            r = requests.get(p, timeout=20)
+    if _HTTP_RE.match(p) and _optional("requests"):
+        try:
+            r = _optional("requests").get(p, timeout=20)
             if r.ok: return r.text
-        path = Path(p)
-        if not path.exists(): return ""
+        except Exception as e:
+            print(f"⚠️ Read failure for {p}: {e}")
+            return ""
+    try:
+        st = os.stat(p)
+    except OSError:
+        return ""
+    return _read_text_cached(p, st.st_mtime_ns, st.st_size)
+
+_PDF_WS_RE = re.compile(r"[ \t]+")
+
+def _pdf_text(pages) -> str:
+    """Page texts in one layout whichever engine extracted them: single spaces, no blank lines."""
+    # PDFium collapses space runs and drops blank lines, PyPDF2 keeps both; normalizing
+    # both keeps the name/company/title line heuristics independent of the installed library
+    lines = []
+    for pg in pages:
+        for ln in pg.splitlines():
+            ln = _PDF_WS_RE.sub(" ", ln).strip()
+            if ln: lines.append(ln)
+    return "\n".join(lines)
+
+@lru_cache(maxsize=32)
+def _read_text_cached(p: str, mtime_ns: int, size: int) -> str:
+    # Keyed on (path, mtime, size): a file is parsed once per process until it changes
+    path = Path(p)
+    try:
         if p.lower().endswith(".txt"):
             return path.read_text(encoding="utf-8", errors="ignore")
-        if p.lower().endswith(".docx") and DOCX_OK:
-            d = docx.Document(str(path))
-            return "\\n".join([pg.text for pg in d.paragraphs])
-        if p.lower().endswith(".pdf") and PDF_READ_OK:
-            txt = []
+        if p.lower().endswith(".docx") and _optional("docx"):
+            d = _optional("docx").Document(str(path))
+            return "\n".join([pg.text for pg in d.paragraphs])
+        if p.lower().endswith(".pdf") and _optional("pypdfium2"):
+            # PDFium (C++) text extraction, preferred; a PDF it cannot open falls through to PyPDF2
+            try:
+                pdf = _optional("pypdfium2").PdfDocument(str(path))
+                try:
+                    return _pdf_text([pg.get_textpage().get_text_range() for pg in pdf])
+                finally:
+                    pdf.close()
+            except Exception:
+                if not _optional("PyPDF2"): raise
+        if p.lower().endswith(".pdf") and _optional("PyPDF2"):
             with open(path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                for pg in reader.pages:
-                    txt.append(pg.extract_text() or "")
-            return "\\n".join(txt)
+                reader = _optional("PyPDF2").PdfReader(f)
+                return _pdf_text([pg.extract_text() or "" for pg in reader.pages])
     except Exception as e:
         print(f"⚠️ Read failure for {p}: {e}")
     return ""
@@ -261,7 +355,7 @@ def payload_to_text(payload)->str:
         for b in j.get("bullets",[]): lines.append("• "+b)
     if payload.get("licenses_certs"): lines.append("Licenses/Certs: " + ", ".join(payload["licenses_certs"]))
     if payload.get("education"): lines.append("Education: " + payload.get("education",""))
-    return "\\n".join(lines)
+    return "\n".join(lines)
 
 # ---------------- Builders / Optimizers ----------------
 VET_CROSSWALK = {
@@ -272,6 +366,7 @@ VET_CROSSWALK = {
     "3D1":"Client Systems → IT Support/Helpdesk",
     "3D2":"Cyber Systems → Systems Admin/SRE",
 }
+_VET_CODE_RES = _word_patterns(VET_CROSSWALK)
 
 def build_initial_payload(name: str, resume_text: str) -> Dict[str, Any]:
     payload = {
@@ -287,17 +382,25 @@ def build_initial_payload(name: str, resume_text: str) -> Dict[str, Any]:
         "education":"Education upon request"
     }
     for code, trans in VET_CROSSWALK.items():
-        if re.search(rf"\\b{re.escape(code)}\\b", resume_text):
+        if _VET_CODE_RES[code].search(resume_text):
             payload["core_items"].append(trans)
     return payload
 
+_NAME_LINE_RE = re.compile(r"^([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))$")
+_NAME_LABEL_RE = re.compile(r"Name[:\-]\s*([A-Z][a-z]+(?:\s[A-Z]\.)?(?:\s[A-Z][a-z]+))")
+
 def guess_name_from_text(resume_text: str) -> str:
     if not resume_text: return ""
-    lines = [ln.strip() for ln in resume_text.splitlines() if ln.strip()]
+    # Only the first 5 non-empty lines matter: split a 2 KB head (cut at a newline so
+    # no line is truncated) instead of the whole resume; a sparse head falls back
+    head = resume_text if len(resume_text) <= 2048 else resume_text[:2048].rpartition("\n")[0]
+    lines = [ln for ln in map(str.strip, head.splitlines()) if ln]
+    if len(lines) < 5 and len(head) < len(resume_text):
+        lines = [ln for ln in map(str.strip, resume_text.splitlines()) if ln]
     for ln in lines[:5]:
-        m = re.match(r"^([A-Z][a-z]+(?:\\s[A-Z]\\.)?(?:\\s[A-Z][a-z]+))$", ln)
+        m = _NAME_LINE_RE.match(ln)
         if m: return m.group(1)
-    m = re.search(r"Name[:\\-]\\s*([A-Z][a-z]+(?:\\s[A-Z]\\.)?(?:\\s[A-Z][a-z]+))", resume_text)
+    m = _NAME_LABEL_RE.search(resume_text)
     return m.group(1) if m else ""
 
 def payload_from_resume(name_hint: str, resume_text: str) -> Dict[str, Any]:
@@ -305,10 +408,11 @@ def payload_from_resume(name_hint: str, resume_text: str) -> Dict[str, Any]:
     final_name = (name_hint or auto or "Candidate").strip()
     return build_initial_payload(final_name, resume_text)
 
-def inject_keywords(payload, jd_text, per_section_caps=(2,2,2)):
-    missing = list(kw_set(jd_text) - kw_set(payload_to_text(payload)))
-    noise = {"and","with","from","will","work","role","team","customer","customers","clients","provide","years","experience","requirements","must","have"}
-    missing = [m for m in missing if m not in noise][:6]
+KW_NOISE = frozenset({"and","with","from","will","work","role","team","customer","customers","clients","provide","years","experience","requirements","must","have"})
+
+def inject_keywords(payload, missing, per_section_caps=(2,2,2)):
+    """`missing`: JD keywords (noise already removed) that the payload lacks."""
+    missing = list(missing)[:6]
     if not missing: return payload
     sum_cap, core_cap, bullet_cap = per_section_caps
     if sum_cap and missing:
@@ -328,23 +432,67 @@ def inject_keywords(payload, jd_text, per_section_caps=(2,2,2)):
         payload["experience"][0]["bullets"] = b
     return payload
 
+METRIC_SHELL = "Improved adoption by [CONFIRM]% and renewal rate by [CONFIRM]% across assigned accounts."
+
 def inject_metric_shell(payload):
     if not payload.get("experience"): return payload
     b = payload["experience"][0].get("bullets", [])
-    if not any(re.search(r"\\d", x) for x in b):
-        b.insert(0, "Improved adoption by [CONFIRM]% and renewal rate by [CONFIRM]% across assigned accounts.")
+    # The shell itself has no digits: without the membership test every optimizer pass re-added it
+    if METRIC_SHELL not in b and not any(map(_DIGIT_RE.search, b)):
+        b.insert(0, METRIC_SHELL)
         payload["experience"][0]["bullets"] = b
     return payload
 
 def optimize_to_target(payload, jd_text, target=95, max_iters=5):
+    jks = kw_set(jd_text)  # the JD is fixed: tokenize it once, not once per iteration
+    wanted = jks - KW_NOISE
+    txt = payload_to_text(payload)
     for _ in range(max_iters):
-        txt = payload_to_text(payload)
+        tks = kw_set(txt)
         cov, ats, hire, _ = composite_scores(jd_text, txt)
         if hire >= target: break
-        payload = inject_keywords(payload, jd_text)
+        payload = inject_keywords(payload, wanted - tks)
         payload = inject_metric_shell(payload)
+        new = payload_to_text(payload)
+        # Fixed point: nothing changed, so every further pass would score and inject the same
+        if new == txt: break
+        txt = new
     return payload
 
+OPT_CACHE_MAX = 32  # newest optimizer results kept in outdir/.cache
+
+def _prune_cache(cache_dir: Path, keep: int=OPT_CACHE_MAX):
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for e in it:
+            if e.name.endswith(".json") and e.is_file():
+                entries.append((e.stat().st_mtime_ns, e.path))
+    entries.sort(reverse=True)
+    for _, p in entries[keep:]:
+        try: os.remove(p)
+        except OSError: pass
+
+def optimize_cached(payload, jd_text, cache_dir: Path, target=95, max_iters=5):
+    """optimize_to_target plus final scores, memoized on disk so a repeat run skips both."""
+    # Keyed on everything the result depends on; the version retires entries when the rules change
+    blob = json.dumps([CURRENT_VERSION, target, max_iters, payload, jd_text], sort_keys=True, ensure_ascii=False)
+    path = cache_dir / f"{hashlib.sha256(blob.encode('utf-8')).hexdigest()}.json"
+    try:
+        hit = (orjson.loads if ORJSON_OK else json.loads)(path.read_bytes())
+        os.utime(path)  # mtime doubles as last use, so pruning drops the least recently used
+        return hit["payload"], tuple(hit["scores"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    payload = optimize_to_target(payload, jd_text, target=target, max_iters=max_iters)
+    scores = composite_scores(jd_text, payload_to_text(payload))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        write_json(path, {"payload": payload, "scores": scores})
+        _prune_cache(cache_dir)
+    except OSError:
+        pass  # a read-only outdir just means no cache
+    return payload, scores
+
 # ---------------- Medical enhancements ----------------
 MED_CERTS = {"CNA","LPN","LVN","RN","BSN","MSN","NP","PA-C","MD","DO","EMT","EMT-B","EMT-I","EMT-P",
              "Paramedic","RRT","CRT","PT","DPT","OT","COTA","SLP","PharmD","RPh","CPhT","CRCST","ARRT",
@@ -356,39 +504,74 @@ MED_SPECIALTIES = {"Emergency","ICU","CCU","Telemetry","Oncology","Pediatrics","
                    "Behavioral Health","Primary Care","Urgent Care","Family Medicine","Internal Medicine","Clinical Research",
                    "Pharmacovigilance","Regulatory Affairs","Revenue Cycle","Medical Billing","Coding"}
 
+# One pattern per term (not one big alternation): "EMT" and "EMT-B" both hit in "EMT-B"
+_MED_CERT_RES = _word_patterns(MED_CERTS)
+_MED_EMR_RES = _word_patterns(MED_EMR)
+_MED_COMP_RES = _word_patterns(MED_COMPLIANCE)
+_MED_SPEC_RES = _word_patterns(MED_SPECIALTIES, re.I)
+# One keyword table tagged by category, so apply_med_enhancements walks the text once
+MED_TERM_TABLES = {"cert": _MED_CERT_RES, "emr": _MED_EMR_RES, "comp": _MED_COMP_RES, "spec": _MED_SPEC_RES}
+_MED_CASED = ("cert", "emr", "comp")
+_MED_AC = _build_automaton(set().union(MED_CERTS, MED_EMR, MED_COMPLIANCE))
+# Specialties match with re.I: scan folded text for candidates, confirm each with its regex
+_MED_SPEC_AC = _build_automaton({t.lower() for t in MED_SPECIALTIES})
+
+def _fold_i(text: str) -> str:
+    # lower() plus the four non-ASCII characters re.I treats as ASCII letters
+    if text.isascii(): return text.lower()
+    return text.replace("\u0130", "i").lower().replace("\u0131", "i").replace("\u017f", "s")
+
+def find_med_terms(text: str) -> Dict[str, list]:
+    """Whole-word hits of every MED_TERM_TABLES entry in `text`, per tag, in table order."""
+    if _MED_AC is None:
+        return {tag: [t for t, pat in table.items() if pat.search(text)] for tag, table in MED_TERM_TABLES.items()}
+    hits = _ac_hits(_MED_AC, text)
+    found = {tag: [t for t in MED_TERM_TABLES[tag] if t in hits] for tag in _MED_CASED}
+    cand = {term for _, term in _MED_SPEC_AC.iter(_fold_i(text))}
+    found["spec"] = [t for t, pat in _MED_SPEC_RES.items() if t.lower() in cand and pat.search(text)]
+    return found
+_YEAR_RE = re.compile(r"\b(20\d{2}|19\d{2})\b")
+_YRS_RE = re.compile(r"\b(\d{1,2})\s+years?\b")
+_SENIOR_RE = re.compile(r"\b(lead|charge nurse|supervisor|manager|director|chief|attending)\b", re.I)
+_RESEARCH_RE = re.compile(r"\b(PI|co-?investigator|IRB|clinical trial|protocol|GCP)\b", re.I)
+
+MED_SNIFF = ("patient","clinic","hospital","emr","ehr","epic","cerner","meditech","provider","nurse","physician","pharmac","radiology","respiratory","triage","icd-10","cpt","hipaa","clinical trial","inpatient","outpatient","charting","billing","coding","revenue cycle")
+# Substring cues (no word edges): the automaton stops at the first hit anywhere. An
+# re.I alternation measured ~30x slower than the `in` loop on non-medical text
+_MED_SNIFF_AC = _build_automaton(MED_SNIFF)
+
 def looks_medical(text: str) -> bool:
     t = (text or "").lower()
-    needles = ["patient","clinic","hospital","emr","ehr","epic","cerner","meditech","provider","nurse","physician","pharmac","radiology","respiratory","triage","icd-10","cpt","hipaa","clinical trial","inpatient","outpatient","charting","billing","coding","revenue cycle"]
-    return any(n in t for n in needles)
-
-def extract_med_certs(text: str):
-    found = []
-    for c in MED_CERTS:
-        if re.search(rf"\\b{re.escape(c)}\\b", text):
-            found.append(c)
-    seen=set(); out=[]
-    for c in found:
-        if c not in seen: seen.add(c); out.append(c)
-    return out
+    if _MED_SNIFF_AC is not None:
+        return next(_MED_SNIFF_AC.iter(t), None) is not None
+    return any(n in t for n in MED_SNIFF)
 
 def infer_med_level(text: str) -> str:
     now = datetime.date.today().year
     yrs = 0
-    for m in re.findall(r"\\b(20\\d{2}|19\\d{2})\\b", text):
+    for m in _YEAR_RE.findall(text):
         y=int(m); 
         if 1970<=y<=now: yrs=max(yrs, now-y)
-    for m in re.findall(r"\\b(\\d{1,2})\\s+years?\\b", text.lower()):
+    for m in _YRS_RE.findall(text.lower()):
         yrs=max(yrs, int(m))
-    senior = bool(re.search(r"\\b(lead|charge nurse|supervisor|manager|director|chief|attending)\\b", text, re.I))
-    research = bool(re.search(r"\\b(PI|co-?investigator|IRB|clinical trial|protocol|GCP)\\b", text, re.I))
+    senior = bool(_SENIOR_RE.search(text))
+    research = bool(_RESEARCH_RE.search(text))
     if yrs>=8 or senior or research: return "advanced"
     if yrs>=3: return "mid"
     return "beginner"
 
+@lru_cache(maxsize=32)
+def _med_profile(both: str):
+    """(level, certs, emr, comp, specs) of a resume+JD text. Pure in the text, so memoized on it."""
+    found = find_med_terms(both)
+    return (infer_med_level(both), tuple(found["cert"]), tuple(found["emr"]),
+            tuple(found["comp"]), tuple(found["spec"]))
+
 def apply_med_enhancements(payload, resume_text, jd_text, domain_mode="auto"):
-    active = (domain_mode=="medical") or (domain_mode=="auto" and looks_medical(resume_text + " " + jd_text))
+    both = (resume_text + " " + jd_text)
+    active = (domain_mode=="medical") or (domain_mode=="auto" and looks_medical(both))
     if not active: return payload
-    level = infer_med_level(resume_text + " " + jd_text)
+    level, certs_found, emr_found, comp_found, specs_found = _med_profile(both)
 
     payload.setdefault("summary","")
     payload.setdefault("core_items",[])
@@ -403,12 +586,6 @@ def apply_med_enhancements(payload, resume_text, jd_text, domain_mode="auto"):
     if "Healthcare" not in payload["summary"]:
         payload["summary"]= (payload["summary"] + (" " if payload["summary"] else "") + starter + " (Healthcare).").strip()
 
-    both = (resume_text + " " + jd_text)
-    certs_found = extract_med_certs(both)
-    emr_found = [e for e in MED_EMR if re.search(rf"\\b{re.escape(e)}\\b", both)]
-    comp_found = [c for c in MED_COMPLIANCE if re.search(rf"\\b{re.escape(c)}\\b", both)]
-    specs_found = [s for s in MED_SPECIALTIES if re.search(rf"\\b{re.escape(s)}\\b", both, re.I)]
-
     def add_core(items):
         cur=[x for x in payload.get("core_items",[]) if x]
         for x in items:
@@ -419,7 +596,7 @@ def apply_med_enhancements(payload, resume_text, jd_text, domain_mode="auto"):
 
     if payload.get("experience"):
         b=payload["experience"][0].get("bullets",[])
-        if not any(re.search(r"\\d",x) for x in b):
+        if not any(map(_DIGIT_RE.search, b)):
             shell = {"beginner":"Supported avg. [CONFIRM] patients/day with [CONFIRM]% chart accuracy; assisted with Electronic Medical Record (EMR) documentation (Epic).",
                      "mid":"Reduced patient throughput time by [CONFIRM]% via triage workflow improvements; maintained ≥[CONFIRM]% patient satisfaction.",
                      "advanced":"Led [CONFIRM]-bed unit; improved quality indicators (falls, central line–associated bloodstream infection) by [CONFIRM]%; sustained average length of stay and HCAHPS targets."
@@ -431,7 +608,9 @@ def apply_med_enhancements(payload, resume_text, jd_text, domain_mode="auto"):
 
 # ---------------- Writers ----------------
 def _rtf_escape(t: str) -> str:
-    return (t or "").replace("\\\\", "\\\\\\\\").replace("{", "\\{").replace("}", "\\}")
+    # Chained replace beats a str.translate table here: replace() is a C scan that
+    # returns the input uncopied when there is nothing to escape
+    return (t or "").replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
 
 def write_rtf_resume(out_path: Path, payload: Dict[str, Any]) -> Path:
     name = _rtf_escape(payload.get("name","Candidate"))
@@ -441,26 +620,27 @@ def write_rtf_resume(out_path: Path, payload: Dict[str, Any]) -> Path:
     lic = ", ".join(payload.get("licenses_certs",[]) or [])
     edu = _rtf_escape(payload.get("education","") or "")
 
-    r = []
-    r.append(r"{\rtf1\ansi\deff0")
-    r.append(r"\fs40\b "+name+r"\b0\par")
-    r.append(r"\qc Email | Phone | City, ST | linkedin.com/in/username\par\ql")
-    r.append(r"\par\b Summary\b0\par "+summary+r"\par")
+    # Streamed into one buffer: no per-line concatenations, no list to join
+    buf = io.StringIO(); w = buf.write
+    w(r"{\rtf1\ansi\deff0" "\n")
+    w(r"\fs40\b "); w(name); w(r"\b0\par" "\n")
+    w(r"\qc Email | Phone | City, ST | linkedin.com/in/username\par\ql" "\n")
+    w(r"\par\b Summary\b0\par "); w(summary); w(r"\par" "\n")
     if core:
-        r.append(r"\par\b Core Skills\b0\par "+_rtf_escape(core)+r"\par")
+        w(r"\par\b Core Skills\b0\par "); w(_rtf_escape(core)); w(r"\par" "\n")
     if exp:
-        r.append(r"\par\b Experience\b0\par")
+        w(r"\par\b Experience\b0\par" "\n")
         for j in exp:
             head = f"{j.get('title','')} — {j.get('company','')} ({j.get('dates','')})"
-            r.append(r"\par\b "+_rtf_escape(head)+r"\b0\par")
+            w(r"\par\b "); w(_rtf_escape(head)); w(r"\b0\par" "\n")
             for b in j.get("bullets",[]) or []:
-                r.append(r"\pard\li480\u8226? "+_rtf_escape(b)+r"\par\pard\li0")
+                w(r"\pard\li480\u8226? "); w(_rtf_escape(b)); w(r"\par\pard\li0" "\n")
     if lic:
-        r.append(r"\par\b Licenses & Certifications\b0\par "+_rtf_escape(lic)+r"\par")
+        w(r"\par\b Licenses & Certifications\b0\par "); w(_rtf_escape(lic)); w(r"\par" "\n")
     if edu:
-        r.append(r"\par\b Education\b0\par "+edu+r"\par")
-    r.append("}")
-    out_path.write_text("\\n".join(r), encoding="utf-8")
+        w(r"\par\b Education\b0\par "); w(edu); w(r"\par" "\n")
+    w("}")
+    out_path.write_text(buf.getvalue(), encoding="utf-8")
     return out_path
 
 def write_rtf_cover(out_path: Path, name:str, company:str, title:str) -> Path:
@@ -473,17 +653,35 @@ I would welcome a conversation to discuss how I can deliver value quickly.
 Sincerely,
 {name}
 """
-    r = []
-    r.append(r"{\rtf1\ansi\deff0")
+    buf = io.StringIO(); w = buf.write
+    w(r"{\rtf1\ansi\deff0" "\n")
     for ln in body.splitlines():
-        r.append(_rtf_escape(ln)+r"\par")
-    r.append("}")
-    out_path.write_text("\\n".join(r), encoding="utf-8")
+        w(_rtf_escape(ln)); w(r"\par" "\n")
+    w("}")
+    out_path.write_text(buf.getvalue(), encoding="utf-8")
     return out_path
 
+def _append_lines(doc, lines):
+    """Bulk-append plain paragraphs as raw OXML, skipping python-docx's per-call Paragraph/Run wrappers."""
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    body = doc.element.body
+    anchor = body.sectPr
+    for ln in lines:
+        p = OxmlElement("w:p")
+        if ln:
+            t = OxmlElement("w:t"); t.text = ln
+            if ln != ln.strip(): t.set(qn("xml:space"), "preserve")
+            r = OxmlElement("w:r"); r.append(t); p.append(r)
+        if anchor is not None: anchor.addprevious(p)
+        else: body.append(p)
+
 def write_docx_resume(out_path: Path, payload):
-    if not DOCX_OK:
+    docx = _optional("docx")
+    if docx is None:
         return write_rtf_resume(out_path.with_suffix(".rtf"), payload)
+    from docx.shared import Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     doc=docx.Document()
     style=doc.styles['Normal']; style.font.name="Calibri"; style.font.size=Pt(11)
 
@@ -509,8 +707,7 @@ def write_docx_resume(out_path: Path, payload):
         doc.add_paragraph().add_run("Experience").bold=True
         for j in payload["experience"]:
             run=doc.add_paragraph().add_run(f"{j.get('title','')} — {j.get('company','')} ({j.get('dates','')})"); run.bold=True
-            for b in j.get("bullets",[]):
-                doc.add_paragraph("• "+b)
+            _append_lines(doc, ["• "+b for b in j.get("bullets",[])])
 
     # Licenses/Certs
     if payload.get("licenses_certs"):
@@ -535,10 +732,12 @@ I would welcome a conversation to discuss how I can deliver value quickly.
 Sincerely,
 {name}
 """
-    if not DOCX_OK:
+    docx = _optional("docx")
+    if docx is None:
         return write_rtf_cover(out_path.with_suffix(".rtf"), name, company, title)
+    from docx.shared import Pt
     doc=docx.Document(); style=doc.styles['Normal']; style.font.name="Calibri"; style.font.size=Pt(11)
-    for ln in content.split("\n"): doc.add_paragraph(ln)
+    _append_lines(doc, content.split("\n"))
     doc.save(str(out_path)); return out_path
 
 def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_snip:str):
@@ -563,8 +762,13 @@ def write_html_guide(out_path: Path, company:str, title:str, scores:dict, jd_sni
 
 # Issue 2: Real PDF guide when ReportLab is available
 def write_pdf_guide(out_pdf: Path, company: str, title: str, scores: dict, jd_snip: str):
-    if not REPORTLAB_OK:
+    if _optional("reportlab.platypus") is None:
         return None
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_LEFT
+    from reportlab.lib.units import inch
     doc = SimpleDocTemplate(str(out_pdf), pagesize=letter,
                             leftMargin=0.8*inch, rightMargin=0.8*inch,
                             topMargin=0.9*inch, bottomMargin=0.9*inch)
@@ -582,13 +786,58 @@ def write_pdf_guide(out_pdf: Path, company: str, title: str, scores: dict, jd_sn
     story.append(Spacer(1, 10))
     story.append(Paragraph("<b>Job Snippet</b>", styles['Heading2']))
     story.append(Paragraph((jd_snip or "")[:1500].replace("\n", "<br/>"), styles['Normal']))
-    doc.build(story)
+    try:
+        doc.build(story)
+    except Exception as e:
+        # The guide is optional output: a render failure must not cost the resume/cover
+        print(f"⚠️ PDF guide failed: {e}")
+        return None
     return out_pdf
 
 def write_redline(out_path: Path, before:str, after:str):
     diff = "\n".join(difflib.unified_diff(before.splitlines(), after.splitlines(), fromfile="before", tofile="after", lineterm=""))
     out_path.write_text(diff, encoding="utf-8"); return out_path
 
+def write_json(out_path: Path, obj):
+    # orjson encodes straight to UTF-8 bytes; stdlib json is the fallback
+    if ORJSON_OK:
+        out_path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2)); return out_path
+    out_path.write_text(json.dumps(obj, indent=2), encoding="utf-8"); return out_path
+
+_LOG_FDS: Dict[str, int] = {}  # append-only log descriptors, kept open for repeated runs in one process
+
+def _close_log_fds():
+    for fd in _LOG_FDS.values():
+        try: os.close(fd)
+        except OSError: pass
+    _LOG_FDS.clear()
+
+atexit.register(_close_log_fds)
+
+def append_ndjson(path: Path, obj):
+    line = (orjson.dumps(obj) if ORJSON_OK else json.dumps(obj).encode("utf-8")) + b"\n"
+    key = str(path)
+    fd = _LOG_FDS.get(key)
+    if fd is not None:
+        # The log (or its folder) was deleted or replaced since it was opened: don't write into the orphan
+        try:
+            stale = os.fstat(fd).st_ino != os.stat(key).st_ino
+        except OSError:
+            stale = True
+        if stale:
+            os.close(fd); fd = None
+    if fd is None:
+        fd = _LOG_FDS[key] = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    # One unbuffered O_APPEND write per record: concurrent runs never interleave inside a line
+    os.write(fd, line)
+
+def run_writers(jobs):
+    """Run (writer, *args) jobs concurrently; returns their results in job order."""
+    # The writers share no state and spend their time in zlib and file IO, which release the GIL
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futs = [ex.submit(fn, *args) for fn, *args in jobs]
+    return [f.result() for f in futs]
+
 def write_ats_txt(out_path: Path, txt:str):
     pre = ("Applicant Tracking System (ATS) notice: This plain text version is optimized for automated scanners.\n"
            "It avoids tables, text boxes, and complex formatting so your resume can be parsed reliably.\n\n")
@@ -599,30 +848,45 @@ RESUME_EXT = (".docx",".pdf",".txt",".rtf")
 JD_EXT = (".docx",".pdf",".txt",".html",".htm")
 
 def detect_files(prefer_dir: Path) -> Dict[str, Path]:
+    # One scandir pass per root; each entry is stat'ed once and carried as (mtime, name, ext, path)
+    exts = set(RESUME_EXT + JD_EXT)
     candidates = []
     for root in {prefer_dir, Path.cwd()}:
-        if not root.exists(): continue
-        for p in root.iterdir():
-            if p.is_file() and p.suffix.lower() in (RESUME_EXT + JD_EXT):
-                if p.name.lower().endswith(".py"): continue
-                candidates.append(p)
-    resumes = [p for p in candidates if any(k in p.name.lower() for k in ["resume","cv"]) or p.suffix.lower() in (".docx",".pdf")]
-    jds = [p for p in candidates if any(k in p.name.lower() for k in ["job","jd","posting","description"]) or p.suffix.lower() in (".txt",".pdf",".html",".htm")]
-    pick_resume = max(resumes, key=lambda x: x.stat().st_mtime, default=None)
-    pick_jd = max(jds, key=lambda x: x.stat().st_mtime, default=None)
-    return {"resume": pick_resume, "jd": pick_jd}
+        try:
+            it = os.scandir(root)
+        except OSError:
+            continue
+        with it:
+            for de in it:
+                ext = os.path.splitext(de.name)[1].lower()
+                if ext not in exts: continue
+                try:
+                    if not de.is_file(): continue
+                    mtime = de.stat().st_mtime
+                except OSError:
+                    continue
+                candidates.append((mtime, de.name.lower(), ext, de.path))
+    resumes = [c for c in candidates if any(k in c[1] for k in ["resume","cv"]) or c[2] in (".docx",".pdf")]
+    jds = [c for c in candidates if any(k in c[1] for k in ["job","jd","posting","description"]) or c[2] in (".txt",".pdf",".html",".htm")]
+    pick_resume = max(resumes, key=lambda c: c[0], default=None)
+    pick_jd = max(jds, key=lambda c: c[0], default=None)
+    return {"resume": Path(pick_resume[3]) if pick_resume else None,
+            "jd": Path(pick_jd[3]) if pick_jd else None}
+
+_COMPANY_RE = re.compile(r"Company[:\-]\s*([^\n]+)", re.I)
+_TITLE_RE = re.compile(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", re.I)
 
 def guess_company_and_title(jd_text: str, jd_path: str="") -> Tuple[str,str]:
     company=""; title=""
-    m = re.search(r"Company[:\-]\s*([^\n]+)", jd_text, re.I); 
+    m = _COMPANY_RE.search(jd_text)
     if m: company = m.group(1).strip()
-    m = re.search(r"(Job\s*Title|Title)[:\-]\s*([^\n]+)", jd_text, re.I)
+    m = _TITLE_RE.search(jd_text)
     if m: title = m.group(2).strip()
     if not title:
         lines=[ln.strip() for ln in jd_text.splitlines() if ln.strip()]
         if lines: title = lines[0][:80]
-    if not company and jd_path and re.match(r"^https?://", str(jd_path)):
-        host = re.sub(r"^https?://","", str(jd_path)).split("/")[0]
+    if not company and jd_path and _HTTP_RE.match(str(jd_path)):
+        host = _HTTP_RE.sub("", str(jd_path)).split("/")[0]
         host = host.split(":")[0]
         parts = host.split(".")
         if len(parts)>=2: company = parts[-2].capitalize()
@@ -631,7 +895,43 @@ def guess_company_and_title(jd_text: str, jd_path: str="") -> Tuple[str,str]:
     return company, title
 
 # ---------------- Main pipeline ----------------
-def auto_mode_run(outdir: Path, check_updates: bool):
+_OUTPUT_SUFFIXES = ("RESUME.docx", "COVER.docx", "GUIDE.html", "GUIDE.pdf", "REDLINE.diff.txt", "ATS.txt")
+
+def _file_part(s: str) -> str:
+    # Chained replace, not translate: on strings this short it is ~10x faster.
+    # Slashes would otherwise turn a title like "RN/BSN" into a missing subdirectory.
+    return s.replace(" ", "_").replace("/", "_").replace("\\", "_")
+
+def _make_output_paths(outdir: Path, name: str, company: str, title: str):
+    base = f"{_file_part(name)}_{_file_part(company or 'Company')}_{_file_part(title or 'Role')}_{TODAY}"
+    return base, tuple(outdir / f"{base}_{suf}" for suf in _OUTPUT_SUFFIXES)
+
+def _input_sig(*paths: Path) -> list:
+    """(mtime_ns, size) of each input plus the version: a stale manifest no longer matches."""
+    sig = []
+    for p in paths:
+        st = os.stat(p); sig += [st.st_mtime_ns, st.st_size]
+    return sig + [CURRENT_VERSION]
+
+def _load_manifest(path: Path):
+    try:
+        return (orjson.loads if ORJSON_OK else json.loads)(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def _print_auto_summary(name, company, title, scores, files, update_check, heading="Files saved:"):
+    print("\n===== HogueResMaster v9.2.2 (Auto Mode) =====")
+    print(f"📄 Name: {name}")
+    print(f"🏢 Company: {company or '[from JD]'}   🧰 Title: {title or '[from JD]'}")
+    print(f"📊 Match: {scores['cov']}%   ⚡ ATS Health: {scores['ats']}%   💼 Hire: {scores['hire']}%   🎓 Grade: {scores['grade']}")
+    if update_check:
+        update_check()
+    print("\n" + heading)
+    for k, v in files.items():
+        if v: print(" •", k, "→", v)
+
+def auto_mode_run(outdir: Path, check_updates: bool, force: bool=False):
+    update_check = start_update_check() if check_updates else None
     outdir.mkdir(parents=True, exist_ok=True)
     found = detect_files(Path("/mnt/data"))
     resume_p, jd_p = found.get("resume"), found.get("jd")
@@ -644,34 +944,37 @@ def auto_mode_run(outdir: Path, check_updates: bool):
     # Build payload and infer name/company/title
     payload = payload_from_resume("", res_text)
     company, title = guess_company_and_title(jd_text, str(jd_p))
+    base, (resume_docx, cover_docx, guide_html, guide_pdf, redline_path, ats_path) = \
+        _make_output_paths(outdir, payload['name'], company, title)
+    manifest_path = outdir / f"{base}_MANIFEST.json"
+
+    # Same inputs, same version, outputs still on disk: nothing to regenerate
+    sig = _input_sig(resume_p, jd_p)
+    prev = None if force else _load_manifest(manifest_path)
+    if prev and prev.get("sig") == sig and all(Path(v).exists() for v in prev.get("files", {}).values() if v):
+        _print_auto_summary(payload['name'], company, title, prev["scores"], prev["files"], update_check,
+                            heading="Inputs unchanged; reusing files (pass --force to rebuild):")
+        return
 
     # Domain enhancements
     payload = apply_med_enhancements(payload, res_text, jd_text, domain_mode="auto")
 
     # Optimize
     before_txt = payload_to_text(payload)
-    payload = optimize_to_target(payload, jd_text, target=95, max_iters=5)
+    payload, (cov, ats, hire, grade) = optimize_cached(payload, jd_text, outdir / ".cache", target=95, max_iters=5)
     after_txt = payload_to_text(payload)
 
-    cov, ats, hire, grade = composite_scores(jd_text, after_txt)
     scores = {"cov":cov,"ats":ats,"hire":hire,"grade":grade}
 
-    base = f"{(payload['name']).replace(' ','_')}_{(company or 'Company').replace(' ','_')}_{(title or 'Role').replace(' ','_')}_{TODAY}"
-
-    resume_docx = outdir / f"{base}_RESUME.docx"
-    cover_docx  = outdir / f"{base}_COVER.docx"
-    guide_html  = outdir / f"{base}_GUIDE.html"
-    guide_pdf   = outdir / f"{base}_GUIDE.pdf"
-    redline_path= outdir / f"{base}_REDLINE.diff.txt"
-    ats_path    = outdir / f"{base}_ATS.txt"
-
     # Write resume/cover; capture actual output paths (docx or rtf)
-    resume_out = write_docx_resume(resume_docx, payload)
-    cover_out  = write_docx_cover(cover_docx, payload['name'], company or "", title or "")
-    write_html_guide(guide_html, company or "", title or "", scores, jd_text[:2000])
-    pdf_made = write_pdf_guide(guide_pdf, company or "", title or "", scores, jd_text[:2000])
-    write_redline(redline_path, before_txt, after_txt)
-    write_ats_txt(ats_path, after_txt)
+    resume_out, cover_out, _, pdf_made, _, _ = run_writers([
+        (write_docx_resume, resume_docx, payload),
+        (write_docx_cover, cover_docx, payload['name'], company or "", title or ""),
+        (write_html_guide, guide_html, company or "", title or "", scores, jd_text[:2000]),
+        (write_pdf_guide, guide_pdf, company or "", title or "", scores, jd_text[:2000]),
+        (write_redline, redline_path, before_txt, after_txt),
+        (write_ats_txt, ats_path, after_txt),
+    ])
 
     # Manifest & run log
     manifest = {
@@ -684,9 +987,10 @@ def auto_mode_run(outdir: Path, check_updates: bool):
             "guide_pdf": str(guide_pdf) if pdf_made else None,
             "ats_txt": str(ats_path),
             "redline_txt": str(redline_path)
-        }
+        },
+        "sig": sig
     }
-    (outdir / f"{base}_MANIFEST.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    write_json(manifest_path, manifest)
 
     logline = {
         "ts": datetime.datetime.now().isoformat(timespec="seconds"),
@@ -696,17 +1000,9 @@ def auto_mode_run(outdir: Path, check_updates: bool):
         "title": title,
         "scores": scores
     }
-    (outdir / "RUN_LOG.ndjson").open("a", encoding="utf-8").write(json.dumps(logline)+"\n")
+    append_ndjson(outdir / "RUN_LOG.ndjson", logline)
 
-    print("\\n===== HogueResMaster v9.2.2 (Auto Mode) =====")
-    print(f"📄 Name: {payload['name']}")
-    print(f"🏢 Company: {company or '[from JD]'}   🧰 Title: {title or '[from JD]'}")
-    print(f"📊 Match: {cov}%   ⚡ ATS Health: {ats}%   💼 Hire: {hire}%   🎓 Grade: {grade}")
-    if check_updates:
-        check_for_update()
-    print("\\nFiles saved:")
-    for k, v in manifest["files"].items():
-        if v: print(" •", k, "→", v)
+    _print_auto_summary(payload['name'], company, title, scores, manifest["files"], update_check)
 
 def build_argparser():
     import argparse
@@ -718,6 +1014,7 @@ def build_argparser():
     ap.add_argument("--resume", default="", help="(Optional) Resume path. If omitted, auto‑detects from uploads.")
     ap.add_argument("--outdir", default="./out", help="Output folder")
     # Issue 3: opt-in update checker
+    ap.add_argument("--force", action="store_true", help="Auto‑mode: rebuild outputs even if the inputs are unchanged since the last run")
     ap.add_argument("--check_updates", default="no", choices=["yes","no"], help="Check GitHub for newer release (default: no)")
     return ap
 
@@ -727,10 +1024,11 @@ def main():
 
     # Auto-mode: no explicit paths provided
     if not args.job and not args.resume:
-        auto_mode_run(outdir, check_updates=(args.check_updates=="yes"))
+        auto_mode_run(outdir, check_updates=(args.check_updates=="yes"), force=args.force)
         return
 
     # Manual mode
+    update_check = start_update_check() if args.check_updates=="yes" else None
     jd_text = read_text_any(args.job)
     res_text = read_text_any(args.resume)
     if not jd_text or not res_text:
@@ -744,31 +1042,28 @@ def main():
 
     payload = apply_med_enhancements(payload, res_text, jd_text, domain_mode="auto")
     before_txt = payload_to_text(payload)
-    payload = optimize_to_target(payload, jd_text, target=95, max_iters=5)
+    payload, (cov, ats, hire, grade) = optimize_cached(payload, jd_text, outdir / ".cache", target=95, max_iters=5)
     after_txt = payload_to_text(payload)
-    cov, ats, hire, grade = composite_scores(jd_text, after_txt)
+    scores = {"cov":cov,"ats":ats,"hire":hire,"grade":grade}
 
-    base = f"{(payload['name']).replace(' ','_')}_{(company or 'Company').replace(' ','_')}_{(title or 'Role').replace(' ','_')}_{TODAY}"
-    resume_docx = outdir / f"{base}_RESUME.docx"
-    cover_docx  = outdir / f"{base}_COVER.docx"
-    guide_html  = outdir / f"{base}_GUIDE.html"
-    guide_pdf   = outdir / f"{base}_GUIDE.pdf"
-    redline_path= outdir / f"{base}_REDLINE.diff.txt"
-    ats_path    = outdir / f"{base}_ATS.txt"
+    base, (resume_docx, cover_docx, guide_html, guide_pdf, redline_path, ats_path) = \
+        _make_output_paths(outdir, payload['name'], company, title)
 
     # Capture actual output paths
-    resume_out = write_docx_resume(resume_docx, payload)
-    cover_out  = write_docx_cover(cover_docx, payload['name'], company or "", title or "")
-    write_html_guide(guide_html, company or "", title or "", {"cov":cov,"ats":ats,"hire":hire,"grade":grade}, jd_text[:2000])
-    pdf_made = write_pdf_guide(guide_pdf, company or "", title or "", {"cov":cov,"ats":ats,"hire":hire,"grade":grade}, jd_text[:2000])
-    write_redline(redline_path, before_txt, after_txt)
-    write_ats_txt(ats_path, after_txt)
-
-    print("\\n===== HogueResMaster v9.2.2 =====")
+    resume_out, cover_out, _, pdf_made, _, _ = run_writers([
+        (write_docx_resume, resume_docx, payload),
+        (write_docx_cover, cover_docx, payload['name'], company or "", title or ""),
+        (write_html_guide, guide_html, company or "", title or "", scores, jd_text[:2000]),
+        (write_pdf_guide, guide_pdf, company or "", title or "", scores, jd_text[:2000]),
+        (write_redline, redline_path, before_txt, after_txt),
+        (write_ats_txt, ats_path, after_txt),
+    ])
+
+    print("\n===== HogueResMaster v9.2.2 =====")
     print(f"🧾 Name: {payload['name']} | 🏢 Company: {company or '[from JD]'} | 🧰 Title: {title or '[from JD]'}")
     print(f"🏷️ Grade: {grade}   🧩 Match: {cov}%   (ATS: {ats}%)   💼 Hire: {hire}%")
-    if args.check_updates=="yes":
-        check_for_update()
+    if update_check:
+        update_check()
     for p in [resume_out, cover_out, guide_html, (guide_pdf if pdf_made else None), redline_path, ats_path]:
         if p: print(" •", p)
 